@@ -274,7 +274,7 @@ class DataViewerWindow(BaseToplevelWindow):
     def _cargar_archivo(self):
         """Maneja el evento de cargar archivo."""
         try:
-            self.df = self.loader.cargar_archivo()
+            self.df = self.loader.cargar_archivo(parent=self)
 
             if self.df is not None:
                 self._mostrar_datos_tabla()
@@ -152,7 +152,7 @@ class AreaResultados:
             tipo = "INFINITA"
             color = "#3498db"
             descripcion = "No se especificó población"
-        elif n <= 0.05 * N:
+        elif 20 * n <= N:
             tipo = "INFINITA"
             color = "#3498db"
             porcentaje = (n / N) * 100
@@ -10,6 +10,16 @@ import math
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
+def _colores_barras(valores_x, x_destacado, color_normal, color_destacado):
+    """
+    Calcula el color de cada barra con una máscara de numpy, resaltando
+    la barra de x_destacado si se indica
+    """
+    if x_destacado is None:
+        return color_normal
+    return np.where(np.asarray(valores_x) == x_destacado, color_destacado, color_normal)
+
+
 class GraficoBinomial:
     """Clase para crear y gestionar gráficos de distribuciones"""
 
@@ -96,12 +106,9 @@ class GraficoBinomial:
         curve_color = "#f39c12"
         normal_color = "#9b59b6"
 
-        colores = []
-        for x in valores_x:
-            if x_destacado is not None and x == x_destacado:
-                colores.append(bar_color_destacado)
-            else:
-                colores.append(bar_color_normal)
+        colores = _colores_barras(
+            valores_x, x_destacado, bar_color_normal, bar_color_destacado
+        )
 
         bar_width = 0.7 if n <= 20 else 0.6 if n <= 50 else 0.5
 
@@ -272,12 +279,9 @@ class GraficoBinomial:
         curve_color = "#f39c12"
         normal_color = "#3498db"
 
-        colores = []
-        for x in valores_x:
-            if x_destacado is not None and x == x_destacado:
-                colores.append(bar_color_destacado)
-            else:
-                colores.append(bar_color_normal)
+        colores = _colores_barras(
+            valores_x, x_destacado, bar_color_normal, bar_color_destacado
+        )
 
         bar_width = 0.7 if len(valores_x) <= 20 else 0.6
 
@@ -443,12 +447,9 @@ class GraficoBinomial:
         curve_color = "#f39c12"
         normal_color = "#3498db"
 
-        colores = []
-        for x in valores_x:
-            if x_destacado is not None and x == x_destacado:
-                colores.append(bar_color_destacado)
-            else:
-                colores.append(bar_color_normal)
+        colores = _colores_barras(
+            valores_x, x_destacado, bar_color_normal, bar_color_destacado
+        )
 
         bar_width = 0.7 if len(valores_x) <= 20 else 0.6
 
@@ -819,12 +820,9 @@ class GraficoBinomial:
         bar_color_normal = "#9b59b6" if es_hipergeometrica else "#3b8ed0"
         bar_color_destacado = "#e74c3c"
 
-        colores = []
-        for x in valores_x:
-            if x_destacado is not None and x == x_destacado:
-                colores.append(bar_color_destacado)
-            else:
-                colores.append(bar_color_normal)
+        colores = _colores_barras(
+            valores_x, x_destacado, bar_color_normal, bar_color_destacado
+        )
 
         bar_width = 0.7 if len(valores_x) <= 20 else 0.6
 
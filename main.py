@@ -3,6 +3,8 @@ Aplicación de Calculadora de Distribución Binomial
 
 Punto de entrada principal de la aplicación.
 """
+import multiprocessing
+
 import customtkinter as ctk
 from ventana_principal import VentanaPrincipal
 
@@ -27,4 +29,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesario para que los procesos del motor arranquen en el ejecutable empaquetado
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -3,7 +3,37 @@ Motor de cálculo de probabilidades para distribuciones binomial e hipergeométr
 Sin dependencias de UI - solo lógica de negocio.
 """
 import math
-from typing import Dict, Tuple, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit: devuelve la función sin compilar."""
+        def decorador(funcion):
+            return funcion
+        return decorador
+
+try:
+    from gmpy2 import comb as _comb
+except ImportError:
+    from math import comb as _comb
+
+try:
+    from scipy.stats import binom, hypergeom
+    SCIPY_DISPONIBLE = True
+except ImportError:
+    SCIPY_DISPONIBLE = False
+
+from tabla_log_factorial import obtener_tabla_log_factorial
 
 
 class ErrorCalculo(Exception):
@@ -16,6 +46,222 @@ class ParametrosInvalidosError(ErrorCalculo):
     pass
 
 
+# Errores que la aritmética puede lanzar con entradas de tipo o rango inesperado
+_ERRORES_NUMERICOS = (TypeError, ValueError, ZeroDivisionError, OverflowError)
+
+# Umbral de la mediana: la PMF en escala logarítmica puede sumar 0.4999…
+# donde la acumulada exacta es 0.5, así que se tolera el redondeo
+_UMBRAL_MEDIANA = 0.5 - 1e-12
+
+
+# Primeras entradas de la tabla ln(k!) compartida con utils.calculos; los
+# núcleos de Numba congelan este arreglo como constante al compilar
+_LGAMMA_MAX = 10_000
+_LGAMMA = obtener_tabla_log_factorial(_LGAMMA_MAX)
+
+
+@njit(cache=True)
+def _log_fact(n):
+    """Calcula ln(n!) desde la tabla precalculada, o con lgamma si n la excede."""
+    if n <= _LGAMMA_MAX:
+        return _LGAMMA[n]
+    return math.lgamma(n + 1)
+
+
+@njit(cache=True, fastmath=True)
+def _log_comb_nb(n, k):
+    """Calcula ln C(n, k) = ln n! - ln k! - ln (n-k)!."""
+    return _log_fact(n) - _log_fact(k) - _log_fact(n - k)
+
+
+def _pmf_binomial_bucle(n, p, out):
+    """
+    Llena out[0..n] con P(X=x) de una Binomial(n, p) sin Numba.
+    
+    Usa la recurrencia ln C(n, x+1) = ln C(n, x) + ln(n-x) - ln(x+1)
+    para evitar aritmética de enteros grandes. Acumula la masa en el mismo
+    recorrido para devolver (indice_mediana, masa_total).
+    """
+    for x in range(n + 1):
+        out[x] = 0.0
+    if p <= 0.0:
+        out[0] = 1.0
+        return 0, 1.0
+    if p >= 1.0:
+        out[n] = 1.0
+        return n, 1.0
+    
+    log_p = math.log(p)
+    log_q = math.log1p(-p)
+    log_comb = 0.0
+    acumulada = 0.0
+    mediana = -1
+    for x in range(n + 1):
+        prob = math.exp(log_comb + x * log_p + (n - x) * log_q)
+        out[x] = prob
+        acumulada += prob
+        if mediana < 0 and acumulada >= _UMBRAL_MEDIANA:
+            mediana = x
+        if x < n:
+            log_comb += math.log(n - x) - math.log(x + 1)
+    
+    return (mediana if mediana >= 0 else n), acumulada
+
+
+def _pmf_hyper_bucle(N, K, n, out):
+    """
+    Llena out[0..n] con P(X=x) de una Hipergeométrica(N, K, n) sin Numba.
+    
+    Parte del mínimo del soporte y aplica la recurrencia
+    P(x+1)/P(x) = (K-x)(n-x) / ((x+1)(N-K-n+x+1)) en escala logarítmica.
+    Devuelve (indice_mediana, masa_total) calculados en el mismo recorrido.
+    """
+    for x in range(n + 1):
+        out[x] = 0.0
+    
+    x_min = max(0, n - (N - K))
+    x_max = min(n, K)
+    if x_min > x_max:
+        return n, 0.0
+    
+    log_prob = (
+        _log_comb_nb(K, x_min)
+        + _log_comb_nb(N - K, n - x_min)
+        - _log_comb_nb(N, n)
+    )
+    acumulada = 0.0
+    mediana = -1
+    for x in range(x_min, x_max + 1):
+        prob = math.exp(log_prob)
+        out[x] = prob
+        acumulada += prob
+        if mediana < 0 and acumulada >= _UMBRAL_MEDIANA:
+            mediana = x
+        if x < x_max:
+            log_prob += (
+                math.log(K - x) + math.log(n - x)
+                - math.log(x + 1) - math.log(N - K - n + x + 1)
+            )
+    
+    return (mediana if mediana >= 0 else n), acumulada
+
+
+def _binom_pmf_escalar(x, n, K, N):
+    """P(X=x) binomial con p = K/N en forma log-gamma (núcleo del ufunc)."""
+    if x < 0 or x > n:
+        return 0.0
+    if K == 0:
+        return 1.0 if x == 0 else 0.0
+    if K == N:
+        return 1.0 if x == n else 0.0
+    p = K / N
+    return math.exp(
+        _log_comb_nb(n, x) + x * math.log(p) + (n - x) * math.log1p(-p)
+    )
+
+
+def _hyper_pmf_escalar(x, N, K, n):
+    """P(X=x) hipergeométrica en forma log-gamma (núcleo del ufunc)."""
+    if x < max(0, n - (N - K)) or x > min(n, K):
+        return 0.0
+    return math.exp(
+        _log_comb_nb(K, x) + _log_comb_nb(N - K, n - x) - _log_comb_nb(N, n)
+    )
+
+
+@lru_cache(maxsize=None)
+def _ufuncs_pmf():
+    """
+    Construye los ufuncs paralelos de Numba la primera vez que se evalúa una
+    PMF, para que importar el motor no pague su compilación (o la carga del
+    caché en disco) ni el arranque del target paralelo.
+    
+    Returns:
+        Tuple: (ufunc_binomial, ufunc_hipergeometrica)
+    """
+    from numba import float64, int64, vectorize
+    
+    firma = [float64(int64, int64, int64, int64)]
+    return (
+        vectorize(firma, target='parallel', cache=True)(_binom_pmf_escalar),
+        vectorize(firma, target='parallel', cache=True)(_hyper_pmf_escalar),
+    )
+
+
+def _resumir_pmf(pmf: np.ndarray) -> Tuple[int, float]:
+    """
+    Recorre una PMF densa indexada desde x=0 con un único cumsum.
+    
+    Returns:
+        Tuple[int, float]: (indice_mediana, masa_total), donde indice_mediana
+        es el primer x con acumulada >= 0.5 salvo redondeo (o el último x si
+        no se alcanza).
+    """
+    acumulada = np.cumsum(pmf)
+    indice = int(np.searchsorted(acumulada, _UMBRAL_MEDIANA, side='left'))
+    return min(indice, len(pmf) - 1), float(acumulada[-1])
+
+
+@lru_cache(maxsize=128)
+def _pmf_con_mediana(N: int, K: int, n: int, modelo: str) -> Tuple[np.ndarray, int, float]:
+    """
+    Calcula P(X=x) para x desde 0 hasta n junto con su mediana y masa total.
+    
+    Con Numba instalado evalúa los ufuncs de _ufuncs_pmf sobre np.arange(n+1);
+    si no, usa la API por lotes de scipy.stats cuando está disponible, y como
+    último recurso recorre los bucles de recurrencia en Python puro, que
+    obtienen la mediana en el mismo recorrido. El resultado se memoiza por
+    (N, K, n, modelo) y la PMF se devuelve como solo lectura para que el
+    caché no pueda alterarse desde fuera.
+    
+    Args:
+        N (int): Tamaño de la población.
+        K (int): Número de éxitos en la población.
+        n (int): Tamaño de la muestra.
+        modelo (str): "Hipergeométrica" o "Binomial".
+    
+    Returns:
+        Tuple[np.ndarray, int, float]: (pmf, indice_mediana, masa_total), con
+        pmf un arreglo float64 de longitud n+1.
+    """
+    if modelo not in ("Hipergeométrica", "Binomial"):
+        raise ParametrosInvalidosError(
+            f"Modelo no reconocido: {modelo}. "
+            "Use 'Hipergeométrica' o 'Binomial'."
+        )
+    
+    if NUMBA_DISPONIBLE or SCIPY_DISPONIBLE:
+        if NUMBA_DISPONIBLE:
+            valores_x = np.arange(n + 1, dtype=np.int64)
+            ufunc_binomial, ufunc_hiper = _ufuncs_pmf()
+            if modelo == "Hipergeométrica":
+                pmf = ufunc_hiper(valores_x, N, K, n)
+            else:
+                pmf = ufunc_binomial(valores_x, n, K, N)
+        else:
+            valores_x = np.arange(n + 1)
+            if modelo == "Hipergeométrica":
+                pmf = hypergeom.pmf(valores_x, N, K, n)
+            else:
+                pmf = binom.pmf(valores_x, n, K / N)
+            pmf = np.ascontiguousarray(pmf, dtype=np.float64)
+        indice_mediana, masa = _resumir_pmf(pmf)
+    else:
+        pmf = np.empty(n + 1, dtype=np.float64)
+        if modelo == "Hipergeométrica":
+            indice_mediana, masa = _pmf_hyper_bucle(N, K, n, pmf)
+        else:
+            indice_mediana, masa = _pmf_binomial_bucle(n, K / N, pmf)
+    
+    pmf.flags.writeable = False
+    return pmf, indice_mediana, masa
+
+
+def _pmf_array(N: int, K: int, n: int, modelo: str) -> np.ndarray:
+    """Devuelve solo la PMF (de solo lectura) de _pmf_con_mediana."""
+    return _pmf_con_mediana(N, K, n, modelo)[0]
+
+
 class ProbabilityEngine:
     """
     Motor de cálculo de probabilidades para distribuciones estadísticas.
@@ -33,6 +279,13 @@ class ProbabilityEngine:
     
     UMBRAL_POBLACION_INFINITA = 0.05
     UMBRAL_HIPERGEOMETRICA = 0.20
+    TOLERANCIA_MASA_PMF = 1e-6
+    ETIQUETAS_SESGO = (
+        "Negativo (media < mediana)",
+        "Nulo (media = mediana)",
+        "Positivo (media > mediana)",
+    )
+    TIPOS_CURTOSIS = ("Platicúrtica", "Mesocúrtica", "Leptocúrtica")
     
     def recomendar_modelo_por_umbral(self, n: int, N: int) -> Dict[str, object]:
         """
@@ -154,18 +407,19 @@ class ProbabilityEngine:
                     f"El tamaño de muestra (n={n}) no puede ser mayor que la población (N={N})."
                 )
             
-            proporcion = n / N
-            
-            if proporcion >= self.UMBRAL_HIPERGEOMETRICA:
-                return "Hipergeométrica"
-            else:
-                return "Binomial"
+            return self._seleccionar_modelo_unsafe(n, N)
                 
         except TypeError as e:
             raise ParametrosInvalidosError(
                 f"Los parámetros deben ser números enteros. Error: {str(e)}"
             )
     
+    def _seleccionar_modelo_unsafe(self, n: int, N: int) -> str:
+        """Elige el modelo por la proporción n/N sin validar n ni N."""
+        if n / N >= self.UMBRAL_HIPERGEOMETRICA:
+            return "Hipergeométrica"
+        return "Binomial"
+    
     def _combinatoria(self, n: int, k: int) -> int:
         """
         Calcula la combinatoria C(n, k) = n! / (k! * (n-k)!).
@@ -181,7 +435,17 @@ class ProbabilityEngine:
             return 0
         if k == 0 or k == n:
             return 1
-        return math.comb(n, k)
+        # Casos pequeños con producto entero desenrollado, sin llamar a math.comb
+        if k == 1 or k == n - 1:
+            return n
+        if k == 2 or k == n - 2:
+            return n * (n - 1) // 2
+        if k == 3 or k == n - 3:
+            return n * (n - 1) * (n - 2) // 6
+        if k == 4 or k == n - 4:
+            return n * (n - 1) * (n - 2) * (n - 3) // 24
+        # gmpy2 (si está instalado) es varias veces más rápido con n grande
+        return int(_comb(n, k))
     
     def calcular_probabilidad(
         self, 
@@ -220,23 +484,52 @@ class ProbabilityEngine:
         try:
             self._validar_parametros_basicos(N, K, n, x)
             
-            if modelo == "Hipergeométrica":
-                return self._probabilidad_hipergeometrica(N, K, n, x)
-            elif modelo == "Binomial":
-                return self._probabilidad_binomial(N, K, n, x)
-            else:
-                raise ParametrosInvalidosError(
-                    f"Modelo no reconocido: {modelo}. "
-                    "Use 'Hipergeométrica' o 'Binomial'."
-                )
+            return self._calcular_probabilidad_unsafe(N, K, n, x, modelo)
                 
-        except ParametrosInvalidosError:
-            raise
-        except Exception as e:
+        except _ERRORES_NUMERICOS as e:
             raise ErrorCalculo(
                 f"Error al calcular la probabilidad: {str(e)}"
             )
     
+    def _calcular_probabilidad_unsafe(
+        self,
+        N: int,
+        K: int,
+        n: int,
+        x: int,
+        modelo: str
+    ) -> float:
+        """
+        Calcula P(X=x) sin validar los parámetros.
+        
+        Pensado para bucles que ya validaron N, K y n una sola vez antes de
+        iterar sobre x; el llamador es responsable de que 0 <= x <= n.
+        """
+        if modelo == "Hipergeométrica":
+            return self._probabilidad_hipergeometrica(N, K, n, x)
+        if modelo == "Binomial":
+            return self._probabilidad_binomial(N, K, n, x)
+        raise ParametrosInvalidosError(
+            f"Modelo no reconocido: {modelo}. "
+            "Use 'Hipergeométrica' o 'Binomial'."
+        )
+    
+    def _validar_completo(self, N: int, K: int, n: int, x: int):
+        """
+        Valida de una vez todo lo que exigen los pasos del resumen completo.
+        
+        Reúne las comprobaciones de seleccionar_modelo, la PMF, la media, la
+        desviación y la curtosis para poder usar después sus variantes
+        sin validación.
+        """
+        self._validar_parametros_basicos(N, K, n, 0)
+        if N <= 3:
+            raise ParametrosInvalidosError("N debe ser mayor a 3 para calcular curtosis.")
+        if K <= 0:
+            raise ParametrosInvalidosError("K debe ser mayor a 0.")
+        if x is None:
+            raise ParametrosInvalidosError("x es obligatorio.")
+    
     def _validar_parametros_basicos(self, N: int, K: int, n: int, x: int):
         """Valida los parámetros básicos para cualquier cálculo."""
         if N is None or N <= 0:
@@ -258,13 +551,11 @@ class ProbabilityEngine:
     
     def _probabilidad_hipergeometrica(self, N: int, K: int, n: int, x: int) -> float:
         """Calcula P(X=x) para distribución hipergeométrica."""
-        numerador = self._combinatoria(K, x) * self._combinatoria(N - K, n - x)
         denominador = self._combinatoria(N, n)
-        
         if denominador == 0:
             return 0.0
         
-        return numerador / denominador
+        return self._combinatoria(K, x) * self._combinatoria(N - K, n - x) / denominador
     
     def _probabilidad_binomial(self, N: int, K: int, n: int, x: int) -> float:
         """Calcula P(X=x) para distribución binomial."""
@@ -276,6 +567,73 @@ class ProbabilityEngine:
         
         return prob
     
+    def calcular_pmf_array(
+        self,
+        N: int,
+        K: int,
+        n: int,
+        modelo: str
+    ) -> np.ndarray:
+        """
+        Calcula la PMF completa como arreglo indexado directamente por x.
+        
+        Es la forma primaria de la distribución: pmf[x] = P(X=x) para x desde
+        0 hasta n. El arreglo es de solo lectura porque se comparte desde el
+        caché; use pmf_a_diccionario() si necesita el formato {x: P(X=x)}.
+        
+        Args:
+            N (int): Tamaño de la población.
+            K (int): Número de éxitos en la población.
+            n (int): Tamaño de la muestra.
+            modelo (str): "Hipergeométrica" o "Binomial".
+        
+        Returns:
+            np.ndarray: Arreglo float64 de longitud n+1.
+        
+        Raises:
+            ParametrosInvalidosError: Si los parámetros son inválidos.
+        """
+        self._validar_parametros_basicos(N, K, n, 0)
+        return _pmf_array(N, K, n, modelo)
+    
+    @staticmethod
+    def pmf_a_diccionario(pmf: np.ndarray) -> Dict[int, float]:
+        """Convierte una PMF indexada por x al formato {x: P(X=x)}."""
+        return dict(enumerate(pmf.tolist()))
+    
+    def probabilidades_rango_array(
+        self,
+        N: int,
+        K: int,
+        n: int,
+        x_max: int,
+        modelo: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve el rango de 0 a x_max como dos arreglos listos para graficar.
+        
+        Las probabilidades son una vista de la PMF en caché (solo lectura),
+        así que no se crea ningún diccionario intermedio.
+        
+        Args:
+            N (int): Tamaño de la población.
+            K (int): Número de éxitos en la población.
+            n (int): Tamaño de la muestra.
+            x_max (int): Valor máximo de x.
+            modelo (str): "Hipergeométrica" o "Binomial".
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (valores_x, probabilidades), con
+            valores_x = 0..limite y limite = min(x_max, n) (y K en la
+            hipergeométrica).
+        
+        Raises:
+            ParametrosInvalidosError: Si los parámetros son inválidos.
+        """
+        pmf = self.calcular_pmf_array(N, K, n, modelo)
+        limite = min(x_max, n, K) if modelo == "Hipergeométrica" else min(x_max, n)
+        return np.arange(limite + 1), pmf[:limite + 1]
+    
     def calcular_probabilidades_rango_x(
         self, 
         N: int, 
@@ -300,15 +658,8 @@ class ProbabilityEngine:
             Dict[int, float]: Diccionario {x: P(X=x)} para x en range(0, x_max+1).
         """
         try:
-            self._validar_parametros_basicos(N, K, n, 0)
-            
-            probabilidades = {}
-            limite = min(x_max, n, K) if modelo == "Hipergeométrica" else min(x_max, n)
-            
-            for x in range(0, limite + 1):
-                probabilidades[x] = self.calcular_probabilidad(N, K, n, x, modelo)
-            
-            return probabilidades
+            _, probs = self.probabilidades_rango_array(N, K, n, x_max, modelo)
+            return self.pmf_a_diccionario(probs)
             
         except (ParametrosInvalidosError, ErrorCalculo):
             raise
@@ -349,18 +700,7 @@ class ProbabilityEngine:
             0.20276679841897233
         """
         try:
-            self._validar_parametros_basicos(N, K, n, 0)
-            
-            probabilidades = {}
-            max_x = min(n, K) if modelo == "Hipergeométrica" else n
-            
-            for x in range(0, max_x + 1):
-                probabilidades[x] = self.calcular_probabilidad(N, K, n, x, modelo)
-            
-            for x in range(max_x + 1, n + 1):
-                probabilidades[x] = 0.0
-            
-            return probabilidades
+            return self.pmf_a_diccionario(self.calcular_pmf_array(N, K, n, modelo))
             
         except (ParametrosInvalidosError, ErrorCalculo):
             raise
@@ -407,18 +747,17 @@ class ProbabilityEngine:
             if n is None or n <= 0:
                 raise ParametrosInvalidosError("n debe ser mayor a 0.")
             
-            p = K / N
-            media = n * p
-            
-            return media
+            return self._media_unsafe(n, K, N)
             
-        except ParametrosInvalidosError:
-            raise
-        except Exception as e:
+        except _ERRORES_NUMERICOS as e:
             raise ErrorCalculo(
                 f"Error al calcular la media: {str(e)}"
             )
     
+    def _media_unsafe(self, n: int, K: int, N: int) -> float:
+        """Calcula μ = n * K / N sin validar los parámetros."""
+        return n * (K / N)
+    
     def calcular_desviacion(
         self, 
         n: int, 
@@ -457,26 +796,28 @@ class ProbabilityEngine:
             if n is None or n <= 0:
                 raise ParametrosInvalidosError("n debe ser mayor a 0.")
             
-            p = K / N
-            q = (N - K) / N
-            
-            if modelo == "Hipergeométrica":
-                if N <= 1:
-                    return 0.0
-                fpc = (N - n) / (N - 1)
-                varianza = n * p * q * fpc
-            else:
-                varianza = n * p * q
+            return self._desviacion_unsafe(n, K, N, modelo)
             
-            return math.sqrt(varianza)
-            
-        except ParametrosInvalidosError:
-            raise
-        except Exception as e:
+        except _ERRORES_NUMERICOS as e:
             raise ErrorCalculo(
                 f"Error al calcular la desviación estándar: {str(e)}"
             )
     
+    def _desviacion_unsafe(self, n: int, K: int, N: int, modelo: str) -> float:
+        """Calcula σ sin validar los parámetros."""
+        p = K / N
+        q = (N - K) / N
+        
+        if modelo == "Hipergeométrica":
+            if N <= 1:
+                return 0.0
+            fpc = (N - n) / (N - 1)
+            varianza = n * p * q * fpc
+        else:
+            varianza = n * p * q
+        
+        return math.sqrt(varianza)
+    
     def calcular_mediana(self, probs: Dict[int, float]) -> float:
         """
         Calcula la mediana de la distribución acumulada.
@@ -506,12 +847,23 @@ class ProbabilityEngine:
                     "El diccionario de probabilidades no puede estar vacío."
                 )
             
-            valores_ordenados = sorted(probs.keys())
+            if min(probs) == 0 and len(probs) == max(probs) + 1:
+                pmf = np.fromiter(
+                    (probs[i] for i in range(len(probs))),
+                    dtype=np.float64,
+                    count=len(probs)
+                )
+                return self._mediana_desde_pmf(pmf)
+            
+            # Los dicts de este módulo ya se insertan en orden ascendente de x
+            valores_ordenados = list(probs.keys())
+            if any(a > b for a, b in zip(valores_ordenados, valores_ordenados[1:])):
+                valores_ordenados.sort()
             
             prob_acumulada = 0.0
             for x in valores_ordenados:
                 prob_acumulada += probs[x]
-                if prob_acumulada >= 0.5:
+                if prob_acumulada >= _UMBRAL_MEDIANA:
                     return float(x)
             
             return float(valores_ordenados[-1])
@@ -523,6 +875,10 @@ class ProbabilityEngine:
                 f"Error al calcular la mediana: {str(e)}"
             )
     
+    def _mediana_desde_pmf(self, pmf: np.ndarray) -> float:
+        """Mediana de una PMF densa indexada desde x=0."""
+        return float(_resumir_pmf(pmf)[0])
+    
     def calcular_sesgo(self, media: float, mediana: float) -> str:
         """
         Determina el tipo de sesgo comparando la media y la mediana.
@@ -549,13 +905,10 @@ class ProbabilityEngine:
             diferencia = media - mediana
             
             if abs(diferencia) < tolerancia:
-                return "Nulo (media = mediana)"
-            elif diferencia < 0:
-                return "Negativo (media < mediana)"
-            else:
-                return "Positivo (media > mediana)"
+                return self.ETIQUETAS_SESGO[1]
+            return self.ETIQUETAS_SESGO[1 + int(math.copysign(1, diferencia))]
                 
-        except Exception as e:
+        except _ERRORES_NUMERICOS as e:
             raise ErrorCalculo(
                 f"Error al calcular el sesgo: {str(e)}"
             )
@@ -590,7 +943,7 @@ class ProbabilityEngine:
         Example:
             >>> engine = ProbabilityEngine()
             >>> engine.calcular_curtosis(25, 6, 4)
-            (38.50867542517721, 'Leptocúrtica')
+            (38.508675425177216, 'Leptocúrtica')
         """
         try:
             if N is None or N <= 3:
@@ -604,45 +957,45 @@ class ProbabilityEngine:
             if n > N:
                 raise ParametrosInvalidosError(f"n ({n}) no puede ser mayor que N ({N}).")
             
-            p = K / N
-            q = 1 - p
-            
-            if N - n <= 0 or N - K <= 0:
-                return 0.0, "Mesocúrtica"
+            return self._curtosis_unsafe(N, K, n)
             
-            varianza = n * p * q * (N - n) / (N - 1)
+        except _ERRORES_NUMERICOS as e:
+            raise ErrorCalculo(
+                f"Error al calcular la curtosis: {str(e)}"
+            )
+    
+    def _curtosis_unsafe(self, N: int, K: int, n: int) -> Tuple[float, str]:
+        """Calcula la curtosis hipergeométrica sin validar los parámetros."""
+        p = K / N
+        pq = p * (1 - p)
+        Nn = N - n
+        Nm1 = N - 1
+        
+        if Nn <= 0 or N - K <= 0:
+            return 0.0, "Mesocúrtica"
+        
+        varianza = n * pq * Nn / Nm1
+        
+        if varianza == 0:
+            return 0.0, "Mesocúrtica"
+        
+        try:
+            # Factor común n·(N-n)·(N-2)·(N-3)·pq del numerador y el denominador
+            factor = n * Nn * (N - 2) * (N - 3) * pq
+            numerador = Nm1 * (N * (N + 1) - 6 * N * Nn * pq + 6 * factor * pq)
+            denominador = factor * varianza
             
-            if varianza == 0:
+            if denominador == 0:
                 return 0.0, "Mesocúrtica"
             
-            try:
-                numerador = (N - 1) * (N * (N + 1) - 6 * N * (N - n) * p * q + 
-                                      6 * n * (N - n) * (N - 2) * (N - 3) * p * p * q * q)
-                denominador = n * (N - n) * (N - 2) * (N - 3) * p * q * varianza
-                
-                if denominador == 0:
-                    return 0.0, "Mesocúrtica"
-                
-                curtosis = numerador / denominador - 3
-                
-            except (ZeroDivisionError, OverflowError):
-                return 0.0, "Mesocúrtica"
+            curtosis = numerador / denominador - 3
             
-            if curtosis > 0.1:
-                tipo = "Leptocúrtica"
-            elif curtosis < -0.1:
-                tipo = "Platicúrtica"
-            else:
-                tipo = "Mesocúrtica"
-            
-            return curtosis, tipo
-            
-        except ParametrosInvalidosError:
-            raise
-        except Exception as e:
-            raise ErrorCalculo(
-                f"Error al calcular la curtosis: {str(e)}"
-            )
+        except (ZeroDivisionError, OverflowError):
+            return 0.0, "Mesocúrtica"
+        
+        tipo = self.TIPOS_CURTOSIS[int(curtosis > 0.1) - int(curtosis < -0.1) + 1]
+        
+        return curtosis, tipo
     
     def calcular_resumen_completo(
         self, 
@@ -654,6 +1007,12 @@ class ProbabilityEngine:
         """
         Calcula un resumen completo con todas las estadísticas.
         
+        La PMF se calcula una sola vez para x de 0 a n; el rango de 0 a x
+        y la mediana se derivan de ese mismo arreglo. El resumen se memoiza
+        por (N, K, n, x), así que reabrir los mismos parámetros no recalcula
+        nada; se devuelven copias de los diccionarios para que el caché no
+        pueda alterarse desde fuera.
+        
         Args:
             N (int): Tamaño de la población.
             K (int): Número de éxitos en la población.
@@ -665,6 +1024,9 @@ class ProbabilityEngine:
                 - modelo: str
                 - probabilidad_x: float
                 - probabilidades_rango: dict (de 0 a x)
+                - pmf_rango: np.ndarray (de 0 a x, indexado por x)
+                - todas_probabilidades: dict (de 0 a n)
+                - pmf: np.ndarray (de 0 a n, indexado por x)
                 - media: float
                 - desviacion: float
                 - mediana: float
@@ -673,32 +1035,180 @@ class ProbabilityEngine:
                 - curtosis_tipo: str
         """
         try:
-            modelo = self.seleccionar_modelo(n, N)
-            
-            probs_rango = self.calcular_probabilidades_rango_x(N, K, n, x, modelo)
-            
-            probs_completas = self.calcular_todas_probabilidades(N, K, n, modelo)
-            
-            media = self.calcular_media(n, K, N, modelo)
-            desviacion = self.calcular_desviacion(n, K, N, modelo)
-            mediana = self.calcular_mediana(probs_completas)
-            sesgo = self.calcular_sesgo(media, mediana)
-            curtosis_valor, curtosis_tipo = self.calcular_curtosis(N, K, n)
-            
-            return {
-                'modelo': modelo,
-                'probabilidad_x': probs_rango.get(x, 0.0),
-                'probabilidades_rango': probs_rango,
-                'todas_probabilidades': probs_completas,
-                'media': media,
-                'desviacion': desviacion,
-                'mediana': mediana,
-                'sesgo': sesgo,
-                'curtosis_valor': curtosis_valor,
-                'curtosis_tipo': curtosis_tipo
-            }
+            self._validar_completo(N, K, n, x)
+            resumen = dict(self._resumen_cacheado(N, K, n, x))
+            resumen['probabilidades_rango'] = dict(resumen['probabilidades_rango'])
+            resumen['todas_probabilidades'] = dict(resumen['todas_probabilidades'])
+            return resumen
             
         except Exception as e:
             raise ErrorCalculo(
                 f"Error al calcular el resumen completo: {str(e)}"
             )
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _resumen_cacheado(cls, N: int, K: int, n: int, x: int) -> Dict:
+        """
+        Calcula el resumen completo sin validar, memoizado por (N, K, n, x).
+        
+        Es un método de clase para que el caché se comparta entre las
+        instancias del motor que crea cada ventana de resultados.
+        """
+        return cls()._resumen_unsafe(N, K, n, x)
+    
+    def _resumen_unsafe(self, N: int, K: int, n: int, x: int) -> Dict:
+        """
+        Calcula el resumen completo asumiendo parámetros ya validados.
+        """
+        modelo = self._seleccionar_modelo_unsafe(n, N)
+        
+        pmf, indice_mediana, masa = _pmf_con_mediana(N, K, n, modelo)
+        if abs(masa - 1.0) > self.TOLERANCIA_MASA_PMF:
+            raise ErrorCalculo(
+                f"La distribución no suma 1 (suma = {masa:.10f})."
+            )
+        
+        limite = min(x, n, K) if modelo == "Hipergeométrica" else min(x, n)
+        pmf_rango = pmf[:limite + 1]
+        probs_completas = self.pmf_a_diccionario(pmf)
+        probs_rango = {xi: probs_completas[xi] for xi in range(limite + 1)}
+        
+        media = self._media_unsafe(n, K, N)
+        desviacion = self._desviacion_unsafe(n, K, N, modelo)
+        mediana = float(indice_mediana)
+        sesgo = self.calcular_sesgo(media, mediana)
+        curtosis_valor, curtosis_tipo = self._curtosis_unsafe(N, K, n)
+        
+        return {
+            'modelo': modelo,
+            'probabilidad_x': probs_rango.get(x, 0.0),
+            'probabilidades_rango': probs_rango,
+            'pmf_rango': pmf_rango,
+            'todas_probabilidades': probs_completas,
+            'pmf': pmf,
+            'media': media,
+            'desviacion': desviacion,
+            'mediana': mediana,
+            'sesgo': sesgo,
+            'curtosis_valor': curtosis_valor,
+            'curtosis_tipo': curtosis_tipo
+        }
+    
+    def resumen_batch(
+        self,
+        N: np.ndarray,
+        K: np.ndarray,
+        n: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula los momentos de muchos escenarios (N, K, n) en una sola llamada.
+        
+        Pensado para barridos de parámetros: los momentos se obtienen con
+        fórmulas cerradas sobre arreglos completos y el resultado se entrega
+        como arreglos paralelos (uno por estadística), no como un dict por
+        escenario.
+        
+        Fórmulas:
+        - μ = n * K / N
+        - Binomial: σ² = n * p * q
+        - Hipergeométrica: σ² = n * p * q * (N-n)/(N-1)
+        
+        Args:
+            N (np.ndarray): Tamaños de población.
+            K (np.ndarray): Éxitos en cada población.
+            n (np.ndarray): Tamaños de muestra.
+        
+        Returns:
+            Dict[str, np.ndarray]: Arreglos 'N', 'K', 'n', 'modelo', 'media',
+            'varianza', 'desviacion' y 'mediana', todos de la misma longitud.
+        
+        Raises:
+            ParametrosInvalidosError: Si algún escenario es inválido o los
+            arreglos no tienen la misma longitud.
+        
+        Example:
+            >>> engine = ProbabilityEngine()
+            >>> r = engine.resumen_batch([25, 100], [6, 30], [4, 25])
+            >>> r['modelo'].tolist()
+            ['Binomial', 'Hipergeométrica']
+        """
+        N = np.asarray(N, dtype=np.int64).ravel()
+        K = np.asarray(K, dtype=np.int64).ravel()
+        n = np.asarray(n, dtype=np.int64).ravel()
+        
+        if not (len(N) == len(K) == len(n)):
+            raise ParametrosInvalidosError(
+                "N, K y n deben tener la misma cantidad de escenarios."
+            )
+        if np.any(N <= 0):
+            raise ParametrosInvalidosError("N debe ser mayor a 0.")
+        if np.any((K < 0) | (K > N)):
+            raise ParametrosInvalidosError("K debe estar entre 0 y N.")
+        if np.any((n <= 0) | (n > N)):
+            raise ParametrosInvalidosError("n debe estar entre 1 y N.")
+        
+        es_hiper = n / N >= self.UMBRAL_HIPERGEOMETRICA
+        modelo = np.where(es_hiper, "Hipergeométrica", "Binomial")
+        
+        p = K / N
+        media = n * p
+        fpc = np.divide(N - n, N - 1, out=np.zeros(len(N)), where=N > 1)
+        varianza = media * (1 - p) * np.where(es_hiper, fpc, 1.0)
+        
+        mediana = np.fromiter(
+            (
+                _pmf_con_mediana(int(Ni), int(Ki), int(ni), str(mi))[1]
+                for Ni, Ki, ni, mi in zip(N, K, n, modelo)
+            ),
+            dtype=np.float64,
+            count=len(N)
+        )
+        
+        return {
+            'N': N,
+            'K': K,
+            'n': n,
+            'modelo': modelo,
+            'media': media,
+            'varianza': varianza,
+            'desviacion': np.sqrt(varianza),
+            'mediana': mediana,
+        }
+    
+    def _resumen_one(self, parametros: Tuple[int, int, int, int]) -> Dict:
+        """Desempaqueta (N, K, n, x) y calcula su resumen completo."""
+        N, K, n, x = parametros
+        return self.calcular_resumen_completo(N, K, n, x)
+    
+    def resumen_batch_parallel(
+        self,
+        params: List[Tuple[int, int, int, int]],
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Calcula el resumen completo de varios escenarios en procesos separados.
+        
+        Cada escenario es independiente, así que se reparten entre un
+        ProcessPoolExecutor para esquivar el GIL. El motor no guarda estado,
+        por lo que enviarlo a los procesos cuesta poco; arrancar los procesos
+        sí cuesta, así que solo compensa con muchos escenarios o n grandes.
+        
+        Args:
+            params (List[Tuple[int, int, int, int]]): Escenarios (N, K, n, x).
+            workers (int, optional): Número máximo de procesos. Por defecto
+                lo decide ProcessPoolExecutor.
+        
+        Returns:
+            List[Dict]: Resúmenes en el mismo orden que params.
+        
+        Raises:
+            ErrorCalculo: Si el cálculo de algún escenario falla.
+        """
+        if not params:
+            return []
+        
+        # "spawn" evita heredar por fork los hilos ya iniciados por Numba
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=contexto) as ejecutor:
+            return list(ejecutor.map(self._resumen_one, params))
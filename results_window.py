@@ -2,19 +2,26 @@
 Ventana para mostrar los resultados del cálculo de probabilidades
 """
 import customtkinter as ctk
+from functools import lru_cache
 from tkinter import filedialog, messagebox
 from typing import Optional, Dict, Any
 
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import numpy as np
 
 from probability_engine import ProbabilityEngine, ErrorCalculo, ParametrosInvalidosError
 from base_window import BaseToplevelWindow
 
 
+@lru_cache(maxsize=32)
+def _fuente(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Devuelve una CTkFont compartida para cada combinación de tamaño y peso."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 class ResultsWindow(BaseToplevelWindow):
     """
     Ventana para mostrar los resultados del cálculo de distribuciones.
@@ -31,6 +38,11 @@ class ResultsWindow(BaseToplevelWindow):
         resultados: Diccionario con todos los resultados calculados.
     """
     
+    # Figura compartida entre aperturas (solo hay una ventana a la vez); se
+    # crea fuera de pyplot y se limpia con cla() en lugar de cerrarse
+    _figura_compartida: Optional[Figure] = None
+    _ax_compartido = None
+    
     def __init__(
         self,
         master=None,
@@ -107,7 +119,7 @@ class ResultsWindow(BaseToplevelWindow):
         titulo = ctk.CTkLabel(
             frame_resultados,
             text="RESULTADOS",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_fuente(18, "bold"),
             text_color=("#1f6aa5", "#1f6aa5")
         )
         titulo.grid(row=0, column=0, pady=(15, 10), sticky="ew")
@@ -132,7 +144,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_titulo = ctk.CTkLabel(
             frame,
             text="MODELO DE DISTRIBUCIÓN",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_fuente(12, "bold"),
             anchor="w"
         )
         lbl_titulo.pack(fill="x", padx=10, pady=(10, 5))
@@ -143,7 +155,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_modelo = ctk.CTkLabel(
             frame,
             text=f"Distribución {modelo}",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_fuente(14, "bold"),
             text_color=color,
             anchor="w"
         )
@@ -158,7 +170,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_justificacion = ctk.CTkLabel(
             frame,
             text=justificacion,
-            font=ctk.CTkFont(size=10),
+            font=_fuente(10),
             text_color="gray",
             anchor="w"
         )
@@ -172,7 +184,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_titulo = ctk.CTkLabel(
             frame,
             text="PROBABILIDAD CALCULADA",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_fuente(12, "bold"),
             anchor="w"
         )
         lbl_titulo.pack(fill="x", padx=10, pady=(10, 5))
@@ -183,7 +195,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_prob = ctk.CTkLabel(
             frame,
             text=f"P(X = {self.x}) = {prob:.6f}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_fuente(16, "bold"),
             text_color="#2ecc71",
             anchor="w"
         )
@@ -192,7 +204,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_porc = ctk.CTkLabel(
             frame,
             text=f"Equivalente: {porcentaje:.4f}%",
-            font=ctk.CTkFont(size=11),
+            font=_fuente(11),
             text_color="gray",
             anchor="w"
         )
@@ -206,15 +218,16 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_titulo = ctk.CTkLabel(
             frame,
             text="ESTADÍSTICAS DESCRIPTIVAS",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_fuente(12, "bold"),
             anchor="w"
         )
         lbl_titulo.pack(fill="x", padx=10, pady=(10, 5))
         
+        resultados = self.resultados
         stats = [
-            ("Media (μ)", f"{self.resultados['media']:.6f}"),
-            ("Desviación estándar (σ)", f"{self.resultados['desviacion']:.6f}"),
-            ("Mediana", f"{self.resultados['mediana']:.1f}"),
+            ("Media (μ)", f"{resultados['media']:.6f}"),
+            ("Desviación estándar (σ)", f"{resultados['desviacion']:.6f}"),
+            ("Mediana", f"{resultados['mediana']:.1f}"),
         ]
         
         for label, valor in stats:
@@ -224,7 +237,7 @@ class ResultsWindow(BaseToplevelWindow):
             lbl = ctk.CTkLabel(
                 frame_stat,
                 text=f"{label}:",
-                font=ctk.CTkFont(size=11),
+                font=_fuente(11),
                 width=160,
                 anchor="w"
             )
@@ -233,7 +246,7 @@ class ResultsWindow(BaseToplevelWindow):
             val = ctk.CTkLabel(
                 frame_stat,
                 text=valor,
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=_fuente(11, "bold"),
                 anchor="w"
             )
             val.pack(side="left", padx=5)
@@ -249,7 +262,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_titulo = ctk.CTkLabel(
             frame,
             text="FORMA DE LA DISTRIBUCIÓN",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_fuente(12, "bold"),
             anchor="w"
         )
         lbl_titulo.pack(fill="x", padx=10, pady=(10, 5))
@@ -260,7 +273,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_sesgo_label = ctk.CTkLabel(
             frame_sesgo,
             text="Sesgo:",
-            font=ctk.CTkFont(size=11),
+            font=_fuente(11),
             width=60,
             anchor="w"
         )
@@ -272,7 +285,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_sesgo_val = ctk.CTkLabel(
             frame_sesgo,
             text=sesgo,
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_fuente(11, "bold"),
             text_color=color_sesgo,
             anchor="w"
         )
@@ -284,7 +297,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_curt_label = ctk.CTkLabel(
             frame_curtosis,
             text="Curtosis:",
-            font=ctk.CTkFont(size=11),
+            font=_fuente(11),
             width=60,
             anchor="w"
         )
@@ -296,7 +309,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_curt_val = ctk.CTkLabel(
             frame_curtosis,
             text=f"{curt_valor:.4f}",
-            font=ctk.CTkFont(size=11),
+            font=_fuente(11),
             anchor="w"
         )
         lbl_curt_val.pack(side="left", padx=5)
@@ -306,7 +319,7 @@ class ResultsWindow(BaseToplevelWindow):
         lbl_curt_tipo = ctk.CTkLabel(
             frame_curtosis,
             text=f"({curt_tipo})",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=_fuente(11, "bold"),
             text_color=color_curt,
             anchor="w"
         )
@@ -322,29 +335,43 @@ class ResultsWindow(BaseToplevelWindow):
         frame_grafico.grid_columnconfigure(0, weight=1)
         frame_grafico.grid_rowconfigure(0, weight=1)
         
-        self._crear_grafico(frame_grafico)
+        # La figura se construye en el siguiente ciclo ocioso de Tk para que
+        # el panel de resultados se pinte sin esperar a matplotlib
+        self.after_idle(self._crear_grafico_diferido, frame_grafico)
+    
+    def _crear_grafico_diferido(self, parent):
+        """Crea la gráfica si la ventana sigue abierta y hay resultados."""
+        if self.resultados is None or not self.winfo_exists():
+            return
+        self._crear_grafico(parent)
     
     def _crear_grafico(self, parent):
         """Crea la gráfica de la distribución."""
-        probs = self.resultados['probabilidades_rango']
-        
-        valores_x = list(probs.keys())
-        valores_prob = list(probs.values())
-        max_prob = max(valores_prob) if valores_prob else 1
-        
-        self.figura, ax = plt.subplots(figsize=(10, 7))
+        # La PMF se calcula en float64; matplotlib rasteriza en float32, así
+        # que la conversión se hace aquí, en la frontera con la gráfica
+        resultados = self.resultados
+        modelo = resultados['modelo']
+        media = resultados['media']
+        desviacion = resultados['desviacion']
+        curtosis_tipo = resultados['curtosis_tipo']
+        prob_x = resultados['probabilidad_x']
+        
+        valores_prob = resultados['pmf_rango'].astype(np.float32)
+        valores_x = np.arange(len(valores_prob), dtype=np.float32)
+        max_prob = valores_prob.max() if valores_prob.size else 1
+        
+        if ResultsWindow._figura_compartida is None:
+            ResultsWindow._figura_compartida = Figure(figsize=(10, 7))
+            ResultsWindow._ax_compartido = ResultsWindow._figura_compartida.subplots()
+        self.figura = ResultsWindow._figura_compartida
+        ax = ResultsWindow._ax_compartido
+        ax.cla()
         self.figura.patch.set_facecolor('#2b2b2b')
         ax.set_facecolor('#2b2b2b')
         
-        modelo = self.resultados['modelo']
         color_normal = '#9b59b6' if modelo == "Hipergeométrica" else '#3b8ed0'
         
-        colores = []
-        for xi in valores_x:
-            if xi == self.x:
-                colores.append('#e74c3c')
-            else:
-                colores.append(color_normal)
+        colores = np.where(valores_x == self.x, '#e74c3c', color_normal)
         
         bars = ax.bar(
             valores_x,
@@ -357,8 +384,10 @@ class ResultsWindow(BaseToplevelWindow):
         )
         
         if len(valores_x) > 1:
-            x_suave = np.linspace(min(valores_x) - 0.5, max(valores_x) + 0.5, 300)
-            y_suave = np.interp(x_suave, valores_x, valores_prob)
+            # La interpolación lineal ya es la poligonal de los puntos: basta
+            # con sus vértices y medio paso plano en cada extremo
+            x_suave = np.concatenate(([valores_x[0] - 0.5], valores_x, [valores_x[-1] + 0.5]))
+            y_suave = np.concatenate((valores_prob[:1], valores_prob, valores_prob[-1:]))
             ax.plot(
                 x_suave,
                 y_suave,
@@ -368,20 +397,23 @@ class ResultsWindow(BaseToplevelWindow):
                 label='Curva de distribución'
             )
         
-        media = self.resultados['media']
-        desviacion = self.resultados['desviacion']
-        
         if desviacion > 0:
             x_normal = np.linspace(
                 max(0, media - 4*desviacion),
                 media + 4*desviacion,
-                200
+                200,
+                dtype=np.float32
             )
-            y_normal = (1 / (desviacion * np.sqrt(2 * np.pi))) * \
-                       np.exp(-0.5 * ((x_normal - media) / desviacion) ** 2)
+            # Se escala al máximo de la PMF, así que el factor 1/(σ√(2π))
+            # sobra; todo se hace en el mismo arreglo
+            y_normal = (x_normal - media) / desviacion
+            np.square(y_normal, out=y_normal)
+            y_normal *= -0.5
+            np.exp(y_normal, out=y_normal)
             
-            if max(y_normal) > 0:
-                y_normal = y_normal * (max_prob / max(y_normal))
+            pico = y_normal.max()
+            if pico > 0:
+                y_normal *= max_prob / pico
             
             color_normal_ref = '#3498db' if modelo == "Hipergeométrica" else '#9b59b6'
             ax.plot(
@@ -394,30 +426,33 @@ class ResultsWindow(BaseToplevelWindow):
                 label='Curva Normal (referencia)'
             )
         
-        for i, (xi, prob) in enumerate(zip(valores_x, valores_prob)):
-            if xi == self.x:
-                ax.text(
-                    xi,
-                    prob + max_prob * 0.05,
-                    f'P(X={xi})={prob:.4f}',
-                    ha='center',
-                    va='bottom',
-                    color='#e74c3c',
-                    fontsize=10,
-                    fontweight='bold',
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='#2b2b2b', edgecolor='#e74c3c')
-                )
-            elif prob > max_prob * 0.05:
-                ax.text(
-                    xi,
-                    prob + max_prob * 0.02,
-                    f'{prob:.3f}',
-                    ha='center',
-                    va='bottom',
-                    color='white',
-                    fontsize=8,
-                    fontweight='bold'
-                )
+        if self.x < len(valores_prob):
+            prob_destacada = valores_prob[self.x]
+            ax.text(
+                self.x,
+                prob_destacada + max_prob * 0.05,
+                f'P(X={self.x})={prob_destacada:.4f}',
+                ha='center',
+                va='bottom',
+                color='#e74c3c',
+                fontsize=10,
+                fontweight='bold',
+                bbox=dict(boxstyle='round,pad=0.3', facecolor='#2b2b2b', edgecolor='#e74c3c')
+            )
+        
+        visibles = (valores_prob > max_prob * 0.05) & (valores_x != self.x)
+        etiquetas = [
+            f'{prob:.3f}' if visible else ''
+            for prob, visible in zip(valores_prob.tolist(), visibles.tolist())
+        ]
+        ax.bar_label(
+            bars,
+            labels=etiquetas,
+            padding=2,
+            color='white',
+            fontsize=8,
+            fontweight='bold'
+        )
         
         text_color = '#ffffff'
         grid_color = '#444444'
@@ -435,8 +470,6 @@ class ResultsWindow(BaseToplevelWindow):
             fontweight='bold'
         )
         
-        curtosis_tipo = self.resultados['curtosis_tipo']
-        prob_x = self.resultados['probabilidad_x']
         titulo_modelo = self.modelo
         ax.set_title(
             f'Distribución {titulo_modelo} — N={self.N}, K={self.K}, n={self.n}, x={self.x}\n'
@@ -488,10 +521,10 @@ class ResultsWindow(BaseToplevelWindow):
         
         ax.set_xticks(valores_x)
         
-        plt.tight_layout()
+        self.figura.tight_layout()
         
         self.canvas = FigureCanvasTkAgg(self.figura, master=parent)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
     
     def _crear_panel_botones(self):
@@ -503,7 +536,7 @@ class ResultsWindow(BaseToplevelWindow):
             frame_botones,
             text="Exportar gráfica como PNG",
             command=self._exportar_grafica,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_fuente(12, "bold"),
             height=38,
             width=200,
             fg_color="#2ecc71",
@@ -515,7 +548,7 @@ class ResultsWindow(BaseToplevelWindow):
             frame_botones,
             text="Cerrar",
             command=self._cerrar_ventana,
-            font=ctk.CTkFont(size=12),
+            font=_fuente(12),
             height=38,
             width=100,
             fg_color="gray",
@@ -525,6 +558,8 @@ class ResultsWindow(BaseToplevelWindow):
     
     def _exportar_grafica(self):
         """Exporta la gráfica como archivo PNG."""
+        if self.figura is None:
+            return
         try:
             from tkinter import filedialog
             
@@ -536,11 +571,12 @@ class ResultsWindow(BaseToplevelWindow):
             )
             
             if nombre_archivo:
+                # tight_layout() ya se aplicó al crear la figura, así que no
+                # hace falta el render extra de bbox_inches='tight'
                 self.figura.savefig(
                     nombre_archivo,
                     dpi=150,
-                    bbox_inches='tight',
-                    facecolor=self.figura.get_facecolor()
+                    pil_kwargs={'compress_level': 1}
                 )
                 messagebox.showinfo(
                     "Exportación exitosa",
@@ -558,9 +594,16 @@ class ResultsWindow(BaseToplevelWindow):
     
     def _al_cerrar(self):
         """Maneja el cierre de la ventana."""
-        super()._limpiar_recursos()
+        self._limpiar_recursos()
         super()._al_cerrar()
     
+    def _limpiar_recursos(self):
+        """Libera el canvas y deja la figura compartida limpia para reutilizarla."""
+        if self.figura is not None:
+            ResultsWindow._ax_compartido.cla()
+            self.figura = None
+        super()._limpiar_recursos()
+    
     def obtener_resultados(self) -> Optional[Dict[str, Any]]:
         """
         Retorna los resultados calculados.
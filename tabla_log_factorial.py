@@ -0,0 +1,43 @@
+"""
+Tabla compartida de ln(k!) para los cálculos en escala logarítmica.
+Solo depende de math y numpy, para que el motor de probabilidades y
+utils.calculos puedan usarla sin arrastrar scipy, pandas ni la interfaz.
+"""
+import math
+
+import numpy as np
+
+
+# La tabla crece bajo demanda hasta LOG_FACT_MAX; por encima, quien llama
+# debe evaluar lnΓ(k+1) directamente
+LOG_FACT_MAX = 100_000
+
+_tabla = np.zeros(1)
+_tabla.flags.writeable = False
+
+
+def obtener_tabla_log_factorial(n: int) -> np.ndarray:
+    """
+    Devuelve la tabla de ln(k!) con al menos n+1 entradas, ampliándola
+    (al doble, para amortizar) si hace falta. Las entradas nuevas salen de
+    math.lgamma, así que son tan exactas como evaluar lnΓ(k+1) cada vez
+
+    Args:
+        n (int): Mayor k que se va a indexar (n <= LOG_FACT_MAX)
+
+    Returns:
+        np.ndarray: Arreglo de solo lectura con tabla[k] = ln(k!)
+    """
+    global _tabla
+    if len(_tabla) <= n:
+        inicio = len(_tabla)
+        tamano = min(max(n + 1, 2 * inicio), LOG_FACT_MAX + 1)
+        nuevas = np.fromiter(
+            (math.lgamma(k + 1) for k in range(inicio, tamano)),
+            dtype=np.float64,
+            count=tamano - inicio,
+        )
+        tabla = np.concatenate((_tabla, nuevas))
+        tabla.flags.writeable = False
+        _tabla = tabla
+    return _tabla
@@ -4,6 +4,7 @@ Pruebas unitarias para funciones de cálculo y validación
 
 import pytest
 import math
+from fractions import Fraction
 from utils.calculos import (
     calcular_probabilidades_acumuladas,
     calcular_probabilidad_acumulada_hipergeometrica,
@@ -12,8 +13,111 @@ from utils.calculos import (
     es_poblacion_infinita,
     binomial_pmf,
     hipergeometrica_pmf,
+    combinatoria,
+    factorial,
+    log_binomial_pmf,
+    calcular_pmf_rango,
+    poisson_pmf,
+    calcular_estadisticas,
+    calcular_sesgo,
+    calcular_curtosis,
+    calcular_desviacion_estandar,
+    calcular_estadisticas_hipergeometrica,
+    calcular_desviacion_hipergeometrica,
+    calcular_sesgo_hipergeometrica,
+    calcular_curtosis_hipergeometrica,
+    calcular_mediana_hipergeometrica,
 )
-from utils.validaciones import validar_parametros_comparacion, validar_tolerancia
+from utils.formato import calcular_moda
+from utils.validaciones import (
+    validar_parametros_comparacion,
+    validar_tolerancia,
+    validar_valores_x,
+    validar_valores_x_hipergeometrica,
+    parsear_valores_x,
+    parsear_valores_x_hipergeometrica,
+    parsear_y_validar_valores_x,
+    parsear_y_validar_valores_x_hipergeometrica,
+)
+
+
+class TestCombinatoria:
+    """Pruebas para factorial y combinatoria con la tabla de factoriales"""
+
+    def test_coincide_con_math_dentro_y_fuera_de_la_tabla(self):
+        for n in (0, 1, 5, 52, 999, 1000, 1001, 1500):
+            assert factorial(n) == math.factorial(n)
+            assert combinatoria(n, n // 3) == math.comb(n, n // 3)
+
+    def test_k_fuera_de_rango_es_cero(self):
+        assert combinatoria(5, 6) == 0
+        assert combinatoria(5, -1) == 0
+
+
+class TestPmfLogaritmica:
+    """Pruebas para las PMF evaluadas en escala logarítmica"""
+
+    def test_log_binomial_coincide_con_formula(self):
+        esperado = math.log(math.comb(10, 3) * 0.3**3 * 0.7**7)
+        assert log_binomial_pmf(3, 10, 0.3) == pytest.approx(esperado)
+        assert log_binomial_pmf(11, 10, 0.3) == -math.inf
+
+    def test_barrido_con_tabla_coincide_con_escalar(self):
+        import numpy as np
+        barrido = binomial_pmf(np.arange(-1, 42), 40, 0.35)
+        assert barrido[0] == 0.0 and barrido[-1] == 0.0
+        for k in range(41):
+            assert barrido[k + 1] == pytest.approx(binomial_pmf(k, 40, 0.35), rel=1e-12)
+
+    def test_pmf_rango_cubre_0_a_n_y_suma_uno(self):
+        pmf = calcular_pmf_rango(30, 0.2)
+        assert pmf.shape == (31,)
+        assert pmf.sum() == pytest.approx(1.0)
+        assert pmf[6] == pytest.approx(binomial_pmf(6, 30, 0.2), rel=1e-12)
+
+    def test_poisson_con_k_grande_no_desborda(self):
+        assert poisson_pmf(3, 2.5) == pytest.approx(math.exp(-2.5) * 2.5**3 / 6)
+        assert poisson_pmf(400, 350.0) == pytest.approx(0.000657256509762594, rel=1e-9)
+
+
+class TestCalcularEstadisticas:
+    """Pruebas para calcular_estadisticas"""
+
+    @pytest.mark.parametrize("n,p,N", [(10, 0.3, None), (10, 0.3, 50), (20, 0.5, 1000)])
+    def test_coincide_con_funciones_individuales(self, n, p, N):
+        estadisticas = calcular_estadisticas(n, p, N)
+
+        assert estadisticas["desviacion"] == calcular_desviacion_estandar(n, p, N)
+        assert (estadisticas["sesgo"], estadisticas["interpretacion_sesgo"]) == calcular_sesgo(n, p, N)
+        assert (estadisticas["curtosis"], estadisticas["interpretacion_curtosis"]) == calcular_curtosis(n, p, N)
+        assert (estadisticas["factor_correccion"] is None) == es_poblacion_infinita(n, N)
+
+
+    @pytest.mark.parametrize("n,N,K", [(5, 20, 8), (10, 50, 25), (3, 3, 1)])
+    def test_hipergeometrica_coincide_con_funciones_individuales(self, n, N, K):
+        estadisticas = calcular_estadisticas_hipergeometrica(n, N, K)
+
+        assert estadisticas["media"] == n * K / N
+        assert estadisticas["desviacion"] == calcular_desviacion_hipergeometrica(n, N, K)
+        assert (estadisticas["sesgo"], estadisticas["interpretacion_sesgo"]) == calcular_sesgo_hipergeometrica(n, N, K)[:2]
+        assert (estadisticas["curtosis"], estadisticas["interpretacion_curtosis"]) == calcular_curtosis_hipergeometrica(n, N, K)
+
+
+class TestCalcularModa:
+    """Pruebas para calcular_moda"""
+
+    @pytest.mark.parametrize(
+        "n,p,esperada",
+        [
+            (9, 0.3, "2 y 3"),
+            (9, Fraction(3, 10), "2 y 3"),
+            (9, 0.0, 0),
+            (9, 1.0, 9),
+            (10, 0.25, 2),
+        ],
+    )
+    def test_moda(self, n, p, esperada):
+        assert calcular_moda(n, p) == esperada
 
 
 class TestEsPoblacionInfinita:
@@ -112,6 +216,37 @@ class TestCalcularProbabilidadesAcumuladasHipergeometrica:
         for i in range(1, len(resultado)):
             assert resultado[i] >= resultado[i - 1]
 
+    def test_coincide_con_scipy_dentro_y_fuera_del_soporte(self):
+        from scipy.stats import hypergeom
+
+        valores_x = list(range(-2, 14))
+        n, N, K = 10, 30, 22
+
+        resultado = calcular_probabilidades_acumuladas_hipergeometrica(
+            valores_x, n, N, K
+        )
+
+        assert resultado == pytest.approx(
+            hypergeom.cdf(valores_x, N, K, n).tolist(), abs=1e-12
+        )
+
+
+class TestCalcularMedianaHipergeometrica:
+    """Pruebas para calcular_mediana_hipergeometrica"""
+
+    @pytest.mark.parametrize("numba", [True, False])
+    @pytest.mark.parametrize(
+        "n,N,K,esperada", [(1, 50, 25, 0), (5, 20, 10, 2), (9, 20, 10, 4), (5, 10, 1, 0)]
+    )
+    def test_acumulada_exactamente_0_5(self, monkeypatch, numba, n, N, K, esperada):
+        import utils.calculos as calculos
+
+        if numba and not calculos.NUMBA_DISPONIBLE:
+            pytest.skip("Numba no está instalado")
+        monkeypatch.setattr(calculos, "NUMBA_DISPONIBLE", numba)
+
+        assert calcular_mediana_hipergeometrica(n, N, K) == esperada
+
 
 class TestBuscarValorTolerancia:
     """Pruebas para buscar_valor_tolerancia"""
@@ -176,6 +311,43 @@ class TestValidarParametrosComparacion:
         assert "tolerancia" in mensaje.lower()
 
 
+class TestParsearYValidarValoresX:
+    """Pruebas para parsear_y_validar_valores_x"""
+
+    def test_x_fuera_de_int64_devuelve_mensaje(self):
+        valores_x, valido, mensaje = parsear_y_validar_valores_x(
+            "3, 99999999999999999999", 10
+        )
+        assert valores_x == [3, 99999999999999999999]
+        assert valido == False
+        assert "mayor que el tamaño de la muestra" in mensaje
+
+    def test_x_negativo_fuera_de_int64_devuelve_mensaje(self):
+        _, valido, mensaje = parsear_y_validar_valores_x("-99999999999999999999, 3", 10)
+        assert valido == False
+        assert "negativo" in mensaje
+
+    @pytest.mark.parametrize("texto", ["", "todos", "7", "-2", "abc", "1, 2,9"])
+    def test_coincide_con_parsear_y_luego_validar(self, texto):
+        valores_x = parsear_valores_x(texto, 5)
+        valido, mensaje = validar_valores_x(valores_x, 5)
+        assert parsear_y_validar_valores_x(texto, 5) == (valores_x, valido, mensaje)
+
+    @pytest.mark.parametrize("texto", ["", "todos", "7", "-2", "abc", "1, 2,9"])
+    def test_hipergeometrica_coincide_con_parsear_y_luego_validar(self, texto):
+        valores_x = parsear_valores_x_hipergeometrica(texto, 5, 3)
+        valido, mensaje = validar_valores_x_hipergeometrica(valores_x, 5, 3)
+        assert parsear_y_validar_valores_x_hipergeometrica(texto, 5, 3) == (
+            valores_x, valido, mensaje
+        )
+
+    @pytest.mark.parametrize("texto, valido", [("7", False), ("1, 2,9", False), ("abc", True)])
+    def test_resultado_esperado_para_n_5(self, texto, valido):
+        _, es_valido, mensaje = parsear_y_validar_valores_x(texto, 5)
+        assert es_valido == valido
+        assert (mensaje == "") == valido
+
+
 class TestValidarTolerancia:
     """Pruebas para validar_tolerancia"""
 
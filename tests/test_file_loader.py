@@ -0,0 +1,59 @@
+"""
+Pruebas para el conteo de frecuencias y la optimización de tipos de FileLoader
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.file_loader import FileLoader
+
+
+def _frecuencias_value_counts(serie):
+    """Conteo de referencia: value_counts sobre los valores sin optimizar."""
+    conteo = serie.astype(object).value_counts()
+    return {str(clave): int(valor) for clave, valor in conteo.items() if valor > 0}
+
+
+def _columnas():
+    return {
+        "texto": pd.Series(["a", "b", "a", None, "c", "a", "b", "a"], dtype=object),
+        "entero_nulable": pd.Series([3, 1, pd.NA, 3, 3, 0, 1, pd.NA], dtype="Int64"),
+        "entero_negativo": pd.Series([-2, 5, -2, 0, 12000, 5, 5, -2], dtype=np.int64),
+        "entero_pequeno": pd.Series([0, 4, 4, 7, 4, 0, 9999, 4], dtype=np.int64),
+        "decimal": pd.Series([1.5, 2.0, 1.5, np.nan, 0.1, 1.5, 2.0, 0.1]),
+    }
+
+
+@pytest.mark.parametrize("columna", list(_columnas()))
+def test_frecuencias_coinciden_con_value_counts_antes_y_despues_de_optimizar(columna):
+    """Optimizar los tipos no cambia las frecuencias de ninguna columna."""
+    loader = FileLoader()
+    df = pd.DataFrame(_columnas())
+    esperado = _frecuencias_value_counts(df[columna])
+
+    assert loader.obtener_frecuencias(df, columna) == esperado
+
+    optimizado = loader._optimizar_tipos(df.copy())
+    assert loader.obtener_frecuencias(optimizado, columna) == esperado
+
+
+def test_optimizar_tipos_reduce_enteros_y_categoriza_texto_repetido():
+    """Los enteros bajan de tamaño, el texto repetido pasa a categoría y los float no cambian."""
+    df = FileLoader()._optimizar_tipos(pd.DataFrame(_columnas()))
+
+    assert df["entero_pequeno"].dtype == np.int16
+    assert df["entero_negativo"].dtype == np.int16
+    assert isinstance(df["texto"].dtype, pd.CategoricalDtype)
+    assert df["decimal"].dtype == np.float64
+
+
+def test_frecuencias_categoricas_con_nulos_omiten_categorias_sin_uso():
+    """Los nulos y las categorías sin filas no aparecen en el conteo."""
+    serie = pd.Categorical(["x", None, "y", "x", None], categories=["x", "y", "z"])
+    df = pd.DataFrame({"cat": serie})
+
+    frecuencias = FileLoader().obtener_frecuencias(df, "cat")
+
+    assert frecuencias == {"x": 2, "y": 1}
+    assert frecuencias == _frecuencias_value_counts(df["cat"])
@@ -0,0 +1,142 @@
+"""
+Pruebas para el cálculo de la PMF completa en ProbabilityEngine.
+"""
+import math
+
+import pytest
+
+from probability_engine import ProbabilityEngine
+
+
+def _hiper_exacta(N, K, n, x):
+    return math.comb(K, x) * math.comb(N - K, n - x) / math.comb(N, n)
+
+
+def _binomial_exacta(N, K, n, x):
+    p = K / N
+    return math.comb(n, x) * p ** x * (1 - p) ** (n - x)
+
+
+@pytest.mark.parametrize("N,K,n", [(25, 6, 4), (100, 30, 25), (20, 15, 10), (1000, 80, 200)])
+def test_todas_probabilidades_hipergeometrica_coincide_con_formula(N, K, n):
+    """La PMF hipergeométrica coincide con C(K,x)·C(N-K,n-x)/C(N,n)."""
+    probs = ProbabilityEngine().calcular_todas_probabilidades(N, K, n, "Hipergeométrica")
+
+    assert list(probs) == list(range(n + 1))
+    for x, prob in probs.items():
+        assert prob == pytest.approx(_hiper_exacta(N, K, n, x), rel=1e-9, abs=1e-15)
+
+
+@pytest.mark.parametrize("N,K,n", [(100, 30, 10), (1000, 5, 100), (100, 0, 10), (100, 100, 10)])
+def test_todas_probabilidades_binomial_coincide_con_formula(N, K, n):
+    """La PMF binomial coincide con C(n,x)·p^x·q^(n-x), incluso para x > K."""
+    probs = ProbabilityEngine().calcular_todas_probabilidades(N, K, n, "Binomial")
+
+    assert list(probs) == list(range(n + 1))
+    for x, prob in probs.items():
+        assert prob == pytest.approx(_binomial_exacta(N, K, n, x), rel=1e-9, abs=1e-15)
+
+
+def test_rango_x_hipergeometrica_se_limita_a_min_n_k():
+    """El rango hipergeométrico no supera min(n, K)."""
+    probs = ProbabilityEngine().calcular_probabilidades_rango_x(25, 3, 10, 8, "Hipergeométrica")
+
+    assert list(probs) == [0, 1, 2, 3]
+    assert probs[2] == pytest.approx(_hiper_exacta(25, 3, 10, 2))
+
+
+@pytest.mark.parametrize("N,K,n,x", [(25, 6, 4, 2), (100, 30, 25, 10), (1000, 80, 100, 12)])
+def test_resumen_completo_reutiliza_la_misma_pmf(N, K, n, x):
+    """El rango, la PMF completa y la mediana del resumen son coherentes entre sí."""
+    engine = ProbabilityEngine()
+    resumen = engine.calcular_resumen_completo(N, K, n, x)
+
+    todas = resumen['todas_probabilidades']
+    assert resumen['probabilidades_rango'] == {xi: todas[xi] for xi in resumen['probabilidades_rango']}
+    assert resumen['probabilidad_x'] == todas[x]
+    assert resumen['pmf_rango'].tolist() == list(resumen['probabilidades_rango'].values())
+    assert resumen['mediana'] == engine.calcular_mediana(todas)
+
+
+@pytest.mark.parametrize("probs,esperada", [
+    ({0: 0.3, 1: 0.4, 2: 0.2, 3: 0.1}, 1.0),
+    ({0: 0.5, 1: 0.5}, 0.0),
+    ({0: 0.1, 1: 0.1}, 1.0),
+    ({2: 0.3, 3: 0.4, 5: 0.3}, 3.0),
+])
+def test_calcular_mediana_rango_denso_y_disperso(probs, esperada):
+    """La mediana es el primer x con acumulada ≥ 0.5, o el último si no se alcanza."""
+    assert ProbabilityEngine().calcular_mediana(probs) == esperada
+
+
+@pytest.mark.parametrize("N,K,n,esperada", [(10, 1, 5, 0.0), (14, 7, 3, 1.0)])
+def test_mediana_con_acumulada_exactamente_0_5(N, K, n, esperada):
+    """Una acumulada exacta de 0.5 que suma 0.4999… en flotante no sube la mediana."""
+    resumen = ProbabilityEngine().calcular_resumen_completo(N, K, n, 0)
+
+    assert resumen['mediana'] == esperada
+
+
+@pytest.mark.parametrize("N,K,n,esperada", [(10, 1, 5, 0), (14, 7, 3, 1)])
+def test_mediana_del_bucle_sin_numba_con_empate(N, K, n, esperada):
+    """El bucle de recurrencia en Python puro resuelve el empate igual."""
+    import numpy as np
+    from probability_engine import _pmf_hyper_bucle
+
+    assert _pmf_hyper_bucle(N, K, n, np.empty(n + 1))[0] == esperada
+
+
+def test_calcular_pmf_array_es_indexable_por_x_y_de_solo_lectura():
+    """La PMF en arreglo coincide con el diccionario y no puede modificarse."""
+    engine = ProbabilityEngine()
+    pmf = engine.calcular_pmf_array(25, 6, 4, "Hipergeométrica")
+
+    assert pmf.shape == (5,)
+    assert engine.pmf_a_diccionario(pmf) == engine.calcular_todas_probabilidades(
+        25, 6, 4, "Hipergeométrica"
+    )
+    with pytest.raises(ValueError):
+        pmf[0] = 1.0
+
+
+def test_resumen_batch_coincide_con_resumen_escalar():
+    """Cada fila del resumen por lotes coincide con el resumen escalar."""
+    engine = ProbabilityEngine()
+    escenarios = [(25, 6, 4), (100, 30, 25), (1000, 80, 100), (200, 50, 60)]
+    N, K, n = zip(*escenarios)
+
+    lote = engine.resumen_batch(N, K, n)
+
+    for i, (Ni, Ki, ni) in enumerate(escenarios):
+        escalar = engine.calcular_resumen_completo(Ni, Ki, ni, 0)
+        assert lote['modelo'][i] == escalar['modelo']
+        assert lote['media'][i] == pytest.approx(escalar['media'])
+        assert lote['desviacion'][i] == pytest.approx(escalar['desviacion'])
+        assert lote['mediana'][i] == escalar['mediana']
+
+
+def test_resumen_batch_parallel_conserva_el_orden():
+    """Los resúmenes en paralelo salen en el orden de los escenarios."""
+    engine = ProbabilityEngine()
+    escenarios = [(25, 6, 4, 2), (100, 30, 25, 10)]
+
+    resultados = engine.resumen_batch_parallel(escenarios, workers=2)
+
+    assert [r['modelo'] for r in resultados] == ['Binomial', 'Hipergeométrica']
+    assert resultados[1]['mediana'] == engine.calcular_resumen_completo(100, 30, 25, 10)['mediana']
+
+
+def test_calcular_mediana_ordena_claves_desordenadas():
+    """Un dict disperso con claves desordenadas se acumula en orden de x."""
+    assert ProbabilityEngine().calcular_mediana({5: 0.3, 2: 0.3, 3: 0.4}) == 3.0
+
+
+def test_resumen_completo_memoizado_devuelve_copias_independientes():
+    """Repetir parámetros reutiliza el caché sin compartir los diccionarios."""
+    primero = ProbabilityEngine().calcular_resumen_completo(100, 30, 25, 10)
+    primero['todas_probabilidades'][0] = -1.0
+
+    segundo = ProbabilityEngine().calcular_resumen_completo(100, 30, 25, 10)
+
+    assert segundo['todas_probabilidades'][0] == pytest.approx(_hiper_exacta(100, 30, 25, 0))
+    assert segundo['pmf'] is primero['pmf']
@@ -6,6 +6,8 @@ from utils.calculos import (
     factorial,
     combinatoria,
     binomial_pmf,
+    log_binomial_pmf,
+    calcular_pmf_rango,
     calcular_media,
     calcular_desviacion_estandar,
     calcular_varianza,
@@ -17,6 +19,7 @@ from utils.calculos import (
     calcular_factor_correccion,
     calcular_sesgo,
     calcular_curtosis,
+    calcular_estadisticas,
     calcular_probabilidades_acumuladas,
     calcular_probabilidad_acumulada_hipergeometrica,
     calcular_probabilidades_acumuladas_hipergeometrica,
@@ -33,6 +36,7 @@ from utils.validaciones import (
     validar_parametros,
     validar_valores_x,
     parsear_valores_x,
+    parsear_y_validar_valores_x,
     validar_parametros_comparacion,
     validar_tolerancia,
     validar_condiciones_poisson,
@@ -62,6 +66,8 @@ __all__ = [
     "factorial",
     "combinatoria",
     "binomial_pmf",
+    "log_binomial_pmf",
+    "calcular_pmf_rango",
     "calcular_media",
     "calcular_desviacion_estandar",
     "calcular_varianza",
@@ -73,6 +79,7 @@ __all__ = [
     "calcular_factor_correccion",
     "calcular_sesgo",
     "calcular_curtosis",
+    "calcular_estadisticas",
     "calcular_probabilidades_acumuladas",
     "calcular_probabilidad_acumulada_hipergeometrica",
     "calcular_probabilidades_acumuladas_hipergeometrica",
@@ -81,6 +88,7 @@ __all__ = [
     "validar_parametros",
     "validar_valores_x",
     "parsear_valores_x",
+    "parsear_y_validar_valores_x",
     "validar_parametros_comparacion",
     "validar_tolerancia",
     "calcular_sesgo_poisson",
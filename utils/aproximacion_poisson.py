@@ -3,12 +3,9 @@ Módulo de aproximación de Poisson para distribuciones Binomial e Hipergeométr
 """
 
 import math
-from scipy.stats import poisson, binom, hypergeom
+from scipy.stats import poisson, hypergeom
 
-
-def _binomial_pmf(k, n, p):
-    """Wrapper para binomial PMF usando scipy (maneja números grandes)"""
-    return float(binom.pmf(k, n, p))
+from utils.calculos import calcular_pmf_rango
 
 
 def _poisson_pmf(k, lam):
@@ -81,9 +78,9 @@ class AproximacionPoissonBinomial:
             tuple: (valores_k, probs_binom, probs_poisson)
         """
         valores_k = list(range(n + 1))
-        probs_binom = [_binomial_pmf(k, n, p) for k in valores_k]
+        probs_binom = calcular_pmf_rango(n, p).tolist()
         lam = n * p
-        probs_poisson = [_poisson_pmf(k, lam) for k in valores_k]
+        probs_poisson = poisson.pmf(valores_k, lam).tolist()
 
         return valores_k, probs_binom, probs_poisson
 
@@ -8,9 +8,131 @@ import math
 from functools import lru_cache
 
 import numpy as np
-from scipy.special import comb
+from scipy.special import betainc, gammaln, xlog1py, xlogy
 from scipy.stats import binom, hypergeom
 
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit: devuelve la función sin compilar."""
+        def decorador(funcion):
+            return funcion
+        return decorador
+
+try:
+    from gmpy2 import comb as _comb
+    GMPY2_DISPONIBLE = True
+except ImportError:
+    from math import comb as _comb
+    GMPY2_DISPONIBLE = False
+
+from tabla_log_factorial import LOG_FACT_MAX, obtener_tabla_log_factorial
+
+# Umbral de la mediana: la PMF en escala logarítmica puede acumular 0.4999…
+# donde la acumulada exacta es 0.5, así que se tolera el redondeo
+_UMBRAL_MEDIANA = 0.5 - 1e-12
+
+
+@njit(cache=True)
+def _binom_pmf_array(n, p, kmax):
+    """
+    Calcula P(X=k) binomial para k = 0..kmax con la recurrencia
+    P(k) = P(k-1) × (n-k+1)/k × p/(1-p), llevada en escala logarítmica
+    para que (1-p)^n no se anule con n grande
+
+    Args:
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito
+        kmax (int): Último valor de k a calcular (0 <= kmax <= n)
+
+    Returns:
+        np.ndarray: Arreglo float64 de longitud kmax+1
+    """
+    pmf = np.zeros(kmax + 1)
+    if p <= 0.0:
+        pmf[0] = 1.0
+        return pmf
+    if p >= 1.0:
+        if kmax == n:
+            pmf[n] = 1.0
+        return pmf
+
+    log_razon = math.log(p) - math.log1p(-p)
+    log_pmf = n * math.log1p(-p)
+    pmf[0] = math.exp(log_pmf)
+    for k in range(1, kmax + 1):
+        log_pmf += math.log(n - k + 1) - math.log(k) + log_razon
+        pmf[k] = math.exp(log_pmf)
+    return pmf
+
+
+@njit(cache=True)
+def _hyper_mediana(n, N, K):
+    """
+    Recorre la PMF hipergeométrica con la recurrencia
+    P(k+1) = P(k) × (K-k)(n-k) / ((k+1)(N-K-n+k+1)) y devuelve el primer k
+    con P(X≤k) >= 0.5 (salvo redondeo, ver _UMBRAL_MEDIANA). El término
+    inicial sale de lgamma y la recurrencia
+    se acumula en escala logarítmica para que no se anule con N grande
+
+    Args:
+        n (int): Tamaño de la muestra
+        N (int): Tamaño de la población
+        K (int): Número de éxitos en la población
+
+    Returns:
+        int: Mediana de la distribución
+    """
+    kmin = max(0, n - (N - K))
+    kmax = min(n, K)
+    log_p0 = (
+        math.lgamma(K + 1) - math.lgamma(kmin + 1) - math.lgamma(K - kmin + 1)
+        + math.lgamma(N - K + 1) - math.lgamma(n - kmin + 1)
+        - math.lgamma(N - K - n + kmin + 1)
+        - math.lgamma(N + 1) + math.lgamma(n + 1) + math.lgamma(N - n + 1)
+    )
+    # La recurrencia se lleva en logaritmos: P(kmin) puede ser menor que el
+    # menor float64 aunque la masa cercana a la moda no lo sea
+    log_pk = log_p0
+    acumulada = math.exp(log_pk)
+    k = kmin
+    while acumulada < _UMBRAL_MEDIANA and k < kmax:
+        log_pk += (
+            math.log(K - k) + math.log(n - k)
+            - math.log(k + 1) - math.log(N - K - n + k + 1)
+        )
+        k += 1
+        acumulada += math.exp(log_pk)
+    return k
+
+
+# Tabla de factoriales 0!, 1!, 2!, ... que crece bajo demanda hasta _FACT_CACHE_MAX
+_FACT_CACHE_MAX = 1000
+_fact_cache = [1]
+
+
+def _fact(n):
+    """
+    Devuelve n! desde la tabla de prefijos, ampliándola con productos
+    acumulados. Por encima de _FACT_CACHE_MAX usa math.factorial para no
+    retener en memoria enteros de miles de dígitos
+
+    Args:
+        n (int): Número entero no negativo
+
+    Returns:
+        int: Factorial de n
+    """
+    if n > _FACT_CACHE_MAX:
+        return math.factorial(n)
+    while len(_fact_cache) <= n:
+        _fact_cache.append(_fact_cache[-1] * len(_fact_cache))
+    return _fact_cache[n]
+
 
 def factorial(n):
     """
@@ -24,14 +146,15 @@ def factorial(n):
     """
     if n <= 1:
         return 1
-    return math.factorial(n)
+    return _fact(n)
 
 
 @lru_cache(maxsize=4096)
 def combinatoria(n, k):
     """
     Calcula la combinatoria C(n,k) = n! / (k! * (n-k)!)
-    Con caché LRU para optimizar llamadas repetidas
+    Usa gmpy2.comb (algoritmo de GMP) si está instalado y, si no, math.comb;
+    ninguno construye n!. Con caché LRU para optimizar llamadas repetidas
 
     Args:
         n (int): Número total de pruebas
@@ -42,25 +165,140 @@ def combinatoria(n, k):
     """
     if k > n or k < 0:
         return 0
-    if k == 0 or k == n:
-        return 1
-    return int(comb(n, k, exact=True))
+    return int(_comb(n, k))
+
+
+def _log_combinatoria(n, k):
+    """
+    Calcula ln C(n,k) con math.lgamma, sin construir enteros grandes
+
+    Args:
+        n (int): Número total de elementos
+        k (int): Número de elementos elegidos (0 <= k <= n)
+
+    Returns:
+        float: Logaritmo natural de C(n,k)
+    """
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def _binom_log_pmf(k, n, logp, log1mp):
+    """
+    Calcula ln P(X=k) binomial con ln(p) y ln(1-p) ya calculados, para que
+    quien evalúe varios k no repita los logaritmos en cada llamada
+
+    Args:
+        k (int): Número de éxitos (0 <= k <= n)
+        n (int): Número de ensayos
+        logp (float): ln(p)
+        log1mp (float): ln(1-p), obtenido con math.log1p(-p)
+
+    Returns:
+        float: Logaritmo natural de P(X=k)
+    """
+    return _log_combinatoria(n, k) + k * logp + (n - k) * log1mp
+
+
+@lru_cache(maxsize=256)
+def _log_denominador_hipergeometrica(N, n):
+    """
+    Devuelve ln C(N,n), el denominador común de toda la PMF hipergeométrica;
+    se memoiza porque un barrido sobre k repite siempre el mismo (N, n)
+
+    Args:
+        N (int): Tamaño de la población
+        n (int): Tamaño de la muestra
+
+    Returns:
+        float: Logaritmo natural de C(N,n)
+    """
+    return _log_combinatoria(N, n)
+
+
+def log_binomial_pmf(k, n, p):
+    """
+    Calcula ln P(X=k) para una distribución binomial en aritmética float64,
+    sin pasar por factoriales enteros; acepta un entero o un arreglo de k
+
+    Fórmula: ln P(X=k) = lnΓ(n+1) - lnΓ(k+1) - lnΓ(n-k+1) + k·ln(p) + (n-k)·ln(1-p)
+
+    Args:
+        k (int | array): Número de éxitos
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito en cada ensayo
+
+    Returns:
+        float | np.ndarray: Logaritmo de la probabilidad (-inf fuera de [0, n]),
+        con la misma forma que k
+    """
+    k_arr = np.asarray(k)
+    en_rango = (k_arr >= 0) & (k_arr <= n)
+    k_val = np.where(en_rango, k_arr, 0)
+
+    if (
+        k_val.ndim > 0
+        and np.issubdtype(k_val.dtype, np.integer)
+        and isinstance(n, (int, np.integer))
+        and n <= LOG_FACT_MAX
+    ):
+        log_fact = obtener_tabla_log_factorial(n)
+        log_comb = log_fact[n] - log_fact[k_val] - log_fact[n - k_val]
+    else:
+        log_comb = gammaln(n + 1) - gammaln(k_val + 1) - gammaln(n - k_val + 1)
+
+    log_pmf = log_comb + xlogy(k_val, p) + xlog1py(n - k_val, -p)
+    log_pmf = np.where(en_rango, log_pmf, -np.inf)
+
+    if log_pmf.ndim == 0:
+        return float(log_pmf)
+    return log_pmf
 
 
 def binomial_pmf(k, n, p):
     """
     Calcula P(X=k) para una distribución binomial
-    Usa scipy para mejor rendimiento con números grandes
+    Evalúa en escala logarítmica y solo exponencia al final; un k entero va
+    por math.lgamma y un arreglo de k por log_binomial_pmf
 
     Fórmula: P(X=k) = C(n,k) × p^k × (1-p)^(n-k)
 
     Args:
-        k (int): Número de éxitos
+        k (int | array): Número de éxitos
         n (int): Número de ensayos
         p (float): Probabilidad de éxito en cada ensayo
 
+    Returns:
+        float | np.ndarray: Probabilidad, con la misma forma que k
     """
-    return float(binom.pmf(k, n, p))
+    if isinstance(k, (int, np.integer)):
+        if k < 0 or k > n:
+            return 0.0
+        if p <= 0:
+            return 1.0 if k == 0 else 0.0
+        if p >= 1:
+            return 1.0 if k == n else 0.0
+        return math.exp(_binom_log_pmf(k, n, math.log(p), math.log1p(-p)))
+
+    pmf = np.exp(log_binomial_pmf(k, n, p))
+    if pmf.ndim == 0:
+        return float(pmf)
+    return pmf
+
+
+def calcular_pmf_rango(n, p):
+    """
+    Calcula P(X=k) binomial para todo k = 0..n en una sola expresión
+    vectorizada sobre la tabla de ln(k!), pensada para las gráficas que
+    recorren el rango completo
+
+    Args:
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito en cada ensayo
+
+    Returns:
+        np.ndarray: Arreglo de n+1 probabilidades indexado por k
+    """
+    return np.exp(log_binomial_pmf(np.arange(n + 1), n, p))
 
 
 def calcular_media(n, p):
@@ -90,10 +328,9 @@ def calcular_desviacion_estandar(n, p, N=None):
         p (float): Probabilidad de éxito
         N (int, optional): Tamaño de la población
     """
-    varianza = n * p * (1 - p)
-    if N is not None and not es_poblacion_infinita(n, N):
-        fpc = math.sqrt((N - n) / (N - 1))
-        return math.sqrt(varianza) * fpc
+    _, varianza, fpc_cuadrado, es_finita = _momentos_binomial(n, p, N)
+    if es_finita:
+        return math.sqrt(varianza) * math.sqrt(fpc_cuadrado)
     return math.sqrt(varianza)
 
 
@@ -111,10 +348,9 @@ def calcular_varianza(n, p, N=None):
         N (int, optional): Tamaño de la población
 
     """
-    varianza = n * p * (1 - p)
-    if N is not None and not es_poblacion_infinita(n, N):
-        fpc = (N - n) / (N - 1)
-        return varianza * fpc
+    _, varianza, fpc_cuadrado, es_finita = _momentos_binomial(n, p, N)
+    if es_finita:
+        return varianza * fpc_cuadrado
     return varianza
 
 
@@ -124,7 +360,8 @@ def es_poblacion_infinita(n, N=None):
 
     La población se considera infinita cuando:
     1. No se especifica tamaño de población (N es None)
-    2. La muestra (n) no excede el 5% de la población (n <= 0.05 * N)
+    2. La muestra (n) no excede el 5% de la población (n <= 0.05 * N),
+       comprobado como 20 * n <= N para que la comparación sea entera y exacta
 
     Args:
         n (int): Tamaño de la muestra
@@ -133,16 +370,36 @@ def es_poblacion_infinita(n, N=None):
     Returns:
         bool: True si la población se considera infinita
     """
-    if N is None:
-        return True
+    return N is None or 20 * n <= N
 
-    return n <= (0.05 * N)
+
+@lru_cache(maxsize=1024)
+def _momentos_binomial(n, p, N=None):
+    """
+    Calcula una sola vez las cantidades que comparten la varianza, la
+    desviación, el sesgo y la curtosis binomiales
+
+    Args:
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito
+        N (int, optional): Tamaño de la población
+
+    Returns:
+        tuple: (q, varianza_infinita, fpc_cuadrado, es_finita), con
+        fpc_cuadrado = (N-n)/(N-1) si la población es finita y 1.0 si no
+    """
+    q = 1 - p
+    varianza_infinita = n * p * q
+    es_finita = not es_poblacion_infinita(n, N)
+    fpc_cuadrado = (N - n) / (N - 1) if es_finita else 1.0
+    return q, varianza_infinita, fpc_cuadrado, es_finita
 
 
 def calcular_probabilidades(valores_x, n, p):
     """
     Calcula las probabilidades para múltiples valores de X
-    Vectorizado con NumPy para mejor rendimiento
+    Con Numba recorre una sola vez la recurrencia compilada _binom_pmf_array;
+    sin él, una sola llamada vectorizada a scipy.stats.binom.pmf
 
     Args:
         valores_x (list): Lista de valores para los cuales calcular P(X=x)
@@ -152,15 +409,69 @@ def calcular_probabilidades(valores_x, n, p):
     Returns:
         list: Lista de probabilidades correspondientes a cada valor de X
     """
-    valores_array = np.array(valores_x)
-    probs = binom.pmf(valores_array, n, p)
+    valores_array = np.asarray(valores_x, dtype=np.int64)
+    if valores_array.size == 0:
+        return []
+
+    if not NUMBA_DISPONIBLE:
+        return binom.pmf(valores_array, n, p).tolist()
+
+    kmax = int(min(valores_array.max(), n))
+    probs = np.zeros(valores_array.size)
+    if kmax >= 0:
+        pmf = _binom_pmf_array(n, p, kmax)
+        en_rango = (valores_array >= 0) & (valores_array <= kmax)
+        probs[en_rango] = pmf[valores_array[en_rango]]
     return probs.tolist()
 
 
+def _binom_cdf(x, n, p):
+    """
+    P(X <= x) binomial como beta incompleta regularizada I_{1-p}(n-x, x+1),
+    una sola llamada a betainc sin la validación de argumentos de binom.cdf
+
+    Args:
+        x (int): Valor máximo
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito
+
+    Returns:
+        float: Probabilidad acumulada
+    """
+    x = math.floor(x)
+    if x < 0:
+        return 0.0
+    if x >= n:
+        return 1.0
+    return float(betainc(n - x, x + 1, 1.0 - p))
+
+
+def _binom_sf(x, n, p):
+    """
+    P(X > x) binomial como I_p(x+1, n-x), calculada directamente para no
+    restar de 1 en la cola derecha
+
+    Args:
+        x (int): Valor de referencia
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito
+
+    Returns:
+        float: Probabilidad de X > x
+    """
+    x = math.floor(x)
+    if x < 0:
+        return 1.0
+    if x >= n:
+        return 0.0
+    return float(betainc(x + 1, n - x, p))
+
+
 def calcular_probabilidad_acumulada(x, n, p):
     """
     Calcula P(X <= x) - probabilidad acumulada hasta x
-    Usa scipy para cálculo eficiente
+    Se evalúa con la beta incompleta regularizada, en tiempo constante sin
+    importar n ni x
 
     Args:
         x (int): Valor máximo
@@ -170,12 +481,14 @@ def calcular_probabilidad_acumulada(x, n, p):
     Returns:
         float: Probabilidad acumulada
     """
-    return float(binom.cdf(x, n, p))
+    return _binom_cdf(x, n, p)
 
 
 def calcular_probabilidad_mayor_que(x, n, p):
     """
     Calcula P(X > x) - probabilidad de ser mayor que x
+    Usa la función de supervivencia, que conserva la precisión en la cola
+    derecha donde 1 - P(X <= x) se cancelaría
 
     Args:
         x (int): Valor de referencia
@@ -185,13 +498,14 @@ def calcular_probabilidad_mayor_que(x, n, p):
     Returns:
         float: Probabilidad de X > x
     """
-    return 1 - calcular_probabilidad_acumulada(x, n, p)
+    return _binom_sf(x, n, p)
 
 
 def calcular_probabilidad_entre(a, b, n, p):
     """
     Calcula P(a <= X <= b) - probabilidad entre dos valores
-    Usa CDF para cálculo eficiente
+    Resta dos CDF, o dos funciones de supervivencia si el tramo está en la
+    cola derecha, para no restar valores cercanos a 1
 
     Args:
         a (int): Límite inferior
@@ -202,9 +516,15 @@ def calcular_probabilidad_entre(a, b, n, p):
     Returns:
         float: Probabilidad entre a y b
     """
+    if b < a:
+        return 0.0
     if a <= 0:
-        return float(binom.cdf(b, n, p))
-    return float(binom.cdf(b, n, p) - binom.cdf(a - 1, n, p))
+        return _binom_cdf(b, n, p)
+
+    acumulada_previa = _binom_cdf(a - 1, n, p)
+    if acumulada_previa <= 0.5:
+        return _binom_cdf(b, n, p) - acumulada_previa
+    return _binom_sf(a - 1, n, p) - _binom_sf(b, n, p)
 
 
 def calcular_factor_correccion(n, N):
@@ -223,6 +543,19 @@ def calcular_factor_correccion(n, N):
     return math.sqrt((N - n) / (N - 1))
 
 
+_INTERP_SESGO = (
+    "Negativo (Asimetría a la izquierda)",
+    "Neutro (Simétrica)",
+    "Positivo (Asimetría a la derecha)",
+)
+
+_INTERP_CURTOSIS = (
+    "Platicúrtica (Curva aplanada)",
+    "Mesocúrtica (Campana de Gauss)",
+    "Leptocúrtica (Curva elevada)",
+)
+
+
 def calcular_sesgo(n, p, N=None):
     """
     Calcula el sesgo (asimetría) de la distribución binomial
@@ -241,24 +574,18 @@ def calcular_sesgo(n, p, N=None):
         float: Valor del sesgo
         str: Interpretación del sesgo (negativo, neutro, positivo)
     """
-    q = 1 - p
-    varianza_infinita = n * p * q
+    _, varianza_infinita, fpc_cuadrado, es_finita = _momentos_binomial(n, p, N)
 
     if varianza_infinita == 0:
         return 0, "Neutro"
 
     sesgo = (1 - 2 * p) / math.sqrt(varianza_infinita)
 
-    if N is not None and not es_poblacion_infinita(n, N):
-        fpc = math.sqrt((N - n) / (N - 1))
-        sesgo = sesgo / fpc
+    if es_finita:
+        sesgo = sesgo / math.sqrt(fpc_cuadrado)
 
-    if sesgo > 0.01:
-        return sesgo, "Positivo (Asimetría a la derecha)"
-    elif sesgo < -0.01:
-        return sesgo, "Negativo (Asimetría a la izquierda)"
-    else:
-        return sesgo, "Neutro (Simétrica)"
+    indice = (sesgo > 0.01) - (sesgo < -0.01) + 1
+    return sesgo, _INTERP_SESGO[indice]
 
 
 def calcular_curtosis(n, p, N=None):
@@ -279,24 +606,50 @@ def calcular_curtosis(n, p, N=None):
         float: Valor de la curtosis (exceso de curtosis)
         str: Interpretación de la curtosis (platicúrtica, mesocúrtica, leptocúrtica)
     """
-    q = 1 - p
-    varianza_infinita = n * p * q
+    q, varianza_infinita, fpc_cuadrado, es_finita = _momentos_binomial(n, p, N)
 
     if varianza_infinita == 0:
         return 0, "Mesocúrtica"
 
     curtosis = (1 - 6 * p * q) / varianza_infinita
 
-    if N is not None and not es_poblacion_infinita(n, N):
-        fpc_cuadrado = (N - n) / (N - 1)
+    if es_finita:
         curtosis = curtosis / fpc_cuadrado
 
-    if curtosis > 0.1:
-        return curtosis, "Leptocúrtica (Curva elevada)"
-    elif curtosis < -0.1:
-        return curtosis, "Platicúrtica (Curva aplanada)"
-    else:
-        return curtosis, "Mesocúrtica (Campana de Gauss)"
+    indice = (curtosis > 0.1) - (curtosis < -0.1) + 1
+    return curtosis, _INTERP_CURTOSIS[indice]
+
+
+def calcular_estadisticas(n, p, N=None):
+    """
+    Calcula de una vez todas las estadísticas binomiales que muestra un
+    reporte; los términos comunes (q, n·p·q y el FPC) salen de un solo
+    _momentos_binomial compartido por las funciones individuales
+
+    Args:
+        n (int): Número de ensayos
+        p (float): Probabilidad de éxito
+        N (int, optional): Tamaño de la población
+
+    Returns:
+        dict: media, desviacion, varianza, factor_correccion (None si la
+        población es infinita), sesgo, interpretacion_sesgo, curtosis e
+        interpretacion_curtosis
+    """
+    _, _, fpc_cuadrado, es_finita = _momentos_binomial(n, p, N)
+    sesgo, interpretacion_sesgo = calcular_sesgo(n, p, N)
+    curtosis, interpretacion_curtosis = calcular_curtosis(n, p, N)
+
+    return {
+        "media": calcular_media(n, p),
+        "desviacion": calcular_desviacion_estandar(n, p, N),
+        "varianza": calcular_varianza(n, p, N),
+        "factor_correccion": math.sqrt(fpc_cuadrado) if es_finita else None,
+        "sesgo": sesgo,
+        "interpretacion_sesgo": interpretacion_sesgo,
+        "curtosis": curtosis,
+        "interpretacion_curtosis": interpretacion_curtosis,
+    }
 
 
 def cumple_condicion_hipergeometrica(n, N):
@@ -320,9 +673,10 @@ def cumple_condicion_hipergeometrica(n, N):
 def hipergeometrica_pmf(k, n, N, K):
     """
     Calcula P(X=k) para una distribución hipergeométrica
-    Usa scipy para mejor rendimiento
+    Evalúa en escala logarítmica con math.lgamma
 
     Fórmula: P(X=k) = C(K,k) × C(N-K, n-k) / C(N, n)
+    ln P(X=k) = ln C(K,k) + ln C(N-K, n-k) - ln C(N, n)
 
     Args:
         k (int): Número de éxitos en la muestra
@@ -335,7 +689,31 @@ def hipergeometrica_pmf(k, n, N, K):
     """
     if k < 0 or k > n or k > K or (n - k) > (N - K):
         return 0.0
-    return float(hypergeom.pmf(k, N, K, n))
+    return math.exp(
+        _log_combinatoria(K, k) + _log_combinatoria(N - K, n - k)
+        - _log_denominador_hipergeometrica(N, n)
+    )
+
+
+@lru_cache(maxsize=256)
+def _momentos_hipergeometrica(n, N, K):
+    """
+    Calcula una sola vez p, q y la varianza que comparten la desviación y
+    la curtosis hipergeométricas
+
+    Args:
+        n (int): Tamaño de la muestra
+        N (int): Tamaño de la población (N > 1)
+        K (int): Número de éxitos en la población
+
+    Returns:
+        tuple: (p, q, varianza) con p = K/N, q = (N-K)/N y
+        varianza = n × p × q × (N-n)/(N-1)
+    """
+    p = K / N
+    q = (N - K) / N
+    varianza = n * p * q * ((N - n) / (N - 1))
+    return p, q, varianza
 
 
 def calcular_media_hipergeometrica(n, N, K):
@@ -374,11 +752,7 @@ def calcular_desviacion_hipergeometrica(n, N, K):
     if N <= 1:
         return 0.0
 
-    p = K / N
-    q = (N - K) / N
-    fpc = (N - n) / (N - 1)
-
-    varianza = n * p * q * fpc
+    _, _, varianza = _momentos_hipergeometrica(n, N, K)
     return math.sqrt(varianza)
 
 
@@ -433,10 +807,7 @@ def calcular_curtosis_hipergeometrica(n, N, K):
     if N <= 3 or K <= 0 or (N - K) <= 0 or n <= 0 or (N - n) <= 0:
         return 0, "Mesocúrtica"
 
-    p = K / N
-    q = 1 - p
-
-    varianza = n * p * q * (N - n) / (N - 1)
+    p, q, varianza = _momentos_hipergeometrica(n, N, K)
 
     if varianza == 0:
         return 0, "Mesocúrtica"
@@ -453,12 +824,62 @@ def calcular_curtosis_hipergeometrica(n, N, K):
 
     curtosis = numerador / denominador - 3
 
-    if curtosis > 0.1:
-        return curtosis, "Leptocúrtica (Curva elevada)"
-    elif curtosis < -0.1:
-        return curtosis, "Platicúrtica (Curva aplanada)"
-    else:
-        return curtosis, "Mesocúrtica (Campana de Gauss)"
+    indice = (curtosis > 0.1) - (curtosis < -0.1) + 1
+    return curtosis, _INTERP_CURTOSIS[indice]
+
+
+def calcular_estadisticas_hipergeometrica(n, N, K):
+    """
+    Calcula de una vez las estadísticas hipergeométricas que muestra un
+    reporte; p, q y la varianza salen de un solo _momentos_hipergeometrica
+    compartido por la desviación y la curtosis
+
+    Args:
+        n (int): Tamaño de la muestra
+        N (int): Tamaño de la población
+        K (int): Número de éxitos en la población
+
+    Returns:
+        dict: media, desviacion, sesgo, interpretacion_sesgo, curtosis e
+        interpretacion_curtosis
+    """
+    sesgo, interpretacion_sesgo, _ = calcular_sesgo_hipergeometrica(n, N, K)
+    curtosis, interpretacion_curtosis = calcular_curtosis_hipergeometrica(n, N, K)
+
+    return {
+        "media": calcular_media_hipergeometrica(n, N, K),
+        "desviacion": calcular_desviacion_hipergeometrica(n, N, K),
+        "sesgo": sesgo,
+        "interpretacion_sesgo": interpretacion_sesgo,
+        "curtosis": curtosis,
+        "interpretacion_curtosis": interpretacion_curtosis,
+    }
+
+
+def _hipergeometrica_pmf_array(k, n, N, K):
+    """
+    Evalúa la PMF hipergeométrica sobre un arreglo de k con la tabla de
+    ln(k!), en lugar de pasar por hypergeom.pmf punto a punto
+
+    Args:
+        k (np.ndarray): Arreglo entero de valores de X
+        n (int): Tamaño de la muestra
+        N (int): Tamaño de la población (N <= LOG_FACT_MAX)
+        K (int): Número de éxitos en la población
+
+    Returns:
+        np.ndarray: P(X=k), con 0 fuera del soporte
+    """
+    log_fact = obtener_tabla_log_factorial(N)
+    en_rango = (k >= max(0, n - (N - K))) & (k <= min(n, K))
+    k_val = np.where(en_rango, k, max(0, n - (N - K)))
+
+    log_pmf = (
+        log_fact[K] - log_fact[k_val] - log_fact[K - k_val]
+        + log_fact[N - K] - log_fact[n - k_val] - log_fact[N - K - n + k_val]
+        - (log_fact[N] - log_fact[n] - log_fact[N - n])
+    )
+    return np.where(en_rango, np.exp(log_pmf), 0.0)
 
 
 def calcular_probabilidades_hipergeometrica(valores_x, n, N, K):
@@ -475,16 +896,19 @@ def calcular_probabilidades_hipergeometrica(valores_x, n, N, K):
     Returns:
         list: Lista de probabilidades correspondientes a cada valor de X
     """
-    valores_array = np.array(valores_x)
-    probs = hypergeom.pmf(valores_array, N, K, n)
-    return probs.tolist()
+    valores_array = np.asarray(valores_x, dtype=np.int64)
+    if N > LOG_FACT_MAX:
+        return hypergeom.pmf(valores_array, N, K, n).tolist()
+    return _hipergeometrica_pmf_array(valores_array, n, N, K).tolist()
 
 
 def calcular_mediana_hipergeometrica(n, N, K):
     """
     Calcula una aproximación de la mediana de la distribución hipergeométrica
     La mediana es el valor donde P(X ≤ m) ≥ 0.5
-    Usa scipy.ppf para cálculo eficiente
+    Con Numba recorre la PMF por recurrencia en código compilado; sin él
+    busca el umbral en la suma acumulada de la PMF sobre el soporte. Ambos
+    caminos toleran el redondeo de una acumulada exacta de 0.5
 
     Args:
         n (int): Tamaño de la muestra
@@ -494,7 +918,24 @@ def calcular_mediana_hipergeometrica(n, N, K):
     Returns:
         int: Mediana aproximada
     """
-    return int(hypergeom.ppf(0.5, N, K, n))
+    if NUMBA_DISPONIBLE:
+        return int(_hyper_mediana(n, N, K))
+
+    kmin = max(0, n - (N - K))
+    soporte = np.arange(kmin, min(n, K) + 1)
+    if N > LOG_FACT_MAX:
+        pmf = hypergeom.pmf(soporte, N, K, n)
+    else:
+        pmf = _hipergeometrica_pmf_array(soporte, n, N, K)
+    indice = int(np.searchsorted(np.cumsum(pmf), _UMBRAL_MEDIANA, side="left"))
+    return kmin + min(indice, len(soporte) - 1)
+
+
+_TIPO_SESGO = (
+    "Negativo (media < mediana)",
+    "Nulo (media = mediana)",
+    "Positivo (media > mediana)",
+)
 
 
 def determinar_tipo_sesgo(media, mediana):
@@ -513,19 +954,15 @@ def determinar_tipo_sesgo(media, mediana):
         str: Descripción del tipo de sesgo
     """
     diferencia = media - mediana
-
-    if abs(diferencia) < 0.001:
-        return "Nulo (media = mediana)"
-    elif diferencia < 0:
-        return "Negativo (media < mediana)"
-    else:
-        return "Positivo (media > mediana)"
+    indice = 1 if abs(diferencia) < 0.001 else (0 if diferencia < 0 else 2)
+    return _TIPO_SESGO[indice]
 
 
 def calcular_probabilidades_acumuladas(valores_x, n, p):
     """
     Calcula las probabilidades acumuladas para múltiples valores de X (Binomial)
-    Vectorizado con NumPy para mejor rendimiento
+    Con Numba genera P(0..max x) con una sola recurrencia y lee cada
+    P(X≤x) de su suma acumulada; sin él usa binom.cdf vectorizado
 
     Args:
         valores_x (list): Lista de valores para los cuales calcular P(X≤x)
@@ -535,8 +972,17 @@ def calcular_probabilidades_acumuladas(valores_x, n, p):
     Returns:
         list: Lista de probabilidades acumuladas en el mismo orden que valores_x
     """
-    valores_array = np.array(valores_x)
-    probs_acum = binom.cdf(valores_array, n, p)
+    valores_array = np.asarray(valores_x, dtype=np.int64)
+    if valores_array.size == 0:
+        return []
+    if not NUMBA_DISPONIBLE:
+        return binom.cdf(valores_array, n, p).tolist()
+
+    kmax = int(min(max(valores_array.max(), 0), n))
+    acumulada = np.cumsum(_binom_pmf_array(n, p, kmax))
+    probs_acum = acumulada[np.clip(valores_array, 0, kmax)]
+    probs_acum[valores_array < 0] = 0.0
+    probs_acum[valores_array >= n] = 1.0
     return probs_acum.tolist()
 
 
@@ -571,8 +1017,17 @@ def calcular_probabilidades_acumuladas_hipergeometrica(valores_x, n, N, K):
     Returns:
         list: Lista de probabilidades acumuladas en el mismo orden que valores_x
     """
-    valores_array = np.array(valores_x)
-    probs_acum = hypergeom.cdf(valores_array, N, K, n)
+    valores_array = np.asarray(valores_x, dtype=np.int64)
+    if N > LOG_FACT_MAX:
+        return hypergeom.cdf(valores_array, N, K, n).tolist()
+
+    # P(X≤x) para todo el soporte con una suma acumulada, luego se indexa
+    maximo = min(n, K)
+    acumuladas = np.cumsum(
+        _hipergeometrica_pmf_array(np.arange(maximo + 1), n, N, K)
+    )
+    probs_acum = acumuladas[np.clip(valores_array, 0, maximo)]
+    probs_acum = np.where(valores_array < 0, 0.0, np.minimum(probs_acum, 1.0))
     return probs_acum.tolist()
 
 
@@ -625,7 +1080,8 @@ def poisson_pmf(k: int, lam: float) -> float:
     Returns:
         float: Probabilidad de exactamente k eventos
     """
-    return (math.exp(-lam) * (lam**k)) / math.factorial(k)
+    # ln P = k·ln(λ) - λ - lnΓ(k+1): evita λ^k y k! como enteros grandes
+    return float(np.exp(xlogy(k, lam) - lam - gammaln(k + 1)))
 
 
 def calcular_media_poisson(n: int, p: float) -> float:
@@ -710,4 +1166,5 @@ def calcular_probabilidades_poisson(valores_x: list[int], lam: float) -> list[fl
     Returns:
         list: Lista de probabilidades correspondientes a cada valor de X
     """
-    return [poisson_pmf(x, lam) for x in valores_x]
+    k = np.asarray(valores_x, dtype=np.float64)
+    return np.exp(xlogy(k, lam) - lam - gammaln(k + 1)).tolist()
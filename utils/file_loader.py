@@ -2,11 +2,28 @@
 Módulo para carga y procesamiento de archivos de datos
 Soporta archivos CSV y Excel (.xlsx)
 """
+import importlib.util
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from tkinter import filedialog
 from typing import Dict, List, Optional
 
+# Solo se comprueba que estén instalados; pandas los importa al leer el
+# primer archivo, así que no encarecen el arranque de la aplicación
+PYARROW_DISPONIBLE = importlib.util.find_spec("pyarrow") is not None
+CALAMINE_DISPONIBLE = importlib.util.find_spec("python_calamine") is not None
+
+# Tamaño a partir del cual el parser de C lee el CSV por bloques
+_UMBRAL_CSV_POR_BLOQUES = 100 * 1024 * 1024
+_FILAS_POR_BLOQUE = 200_000
+
+# Mayor valor entero para el que se cuentan frecuencias con np.bincount
+# (un arreglo de conteos de ese tamaño) en vez de con value_counts
+_MAX_VALOR_BINCOUNT = 10_000
+
 
 class ErrorCargaArchivo(Exception):
     """Excepción base para errores de carga de archivos"""
@@ -49,13 +66,24 @@ class FileLoader:
     def __init__(self):
         """Inicializa el FileLoader."""
         self.ultima_ruta: Optional[str] = None
+        self.ultimo_tamano: Optional[int] = None
+        # Reduce los tipos de columna tras cargar (ver _optimizar_tipos)
+        self.optimizar_tipos = True
         self._extensiones_validas = ('.xlsx', '.xls', '.csv')
+        # id(df) -> (df.columns, encabezados); la entrada se borra al liberarse df
+        self._cache_encabezados: Dict[int, tuple] = {}
+        # id(df) -> (forma, df.columns, ultima_ruta, resumen), con el mismo borrado
+        self._cache_resumen: Dict[int, tuple] = {}
     
-    def cargar_archivo(self, titulo: str = "Seleccionar archivo de datos") -> pd.DataFrame:
+    def cargar_archivo(
+        self, titulo: str = "Seleccionar archivo de datos", parent=None
+    ) -> pd.DataFrame:
         """
         Abre un diálogo para seleccionar y cargar un archivo de datos.
         
-        Soporta archivos Excel (.xlsx, .xls) y CSV (.csv).
+        Soporta archivos Excel (.xlsx, .xls) y CSV (.csv). Si se indica
+        parent, el diálogo se abre sobre esa ventana con su intérprete de Tk
+        ya existente, sin crear una raíz temporal.
         """
         tipos_archivo = [
             ("Archivos Excel", "*.xlsx *.xls"),
@@ -63,9 +91,11 @@ class FileLoader:
             ("Todos los archivos soportados", "*.xlsx *.xls *.csv")
         ]
         
+        opciones_dialogo = {'parent': parent} if parent is not None else {}
         ruta_archivo = filedialog.askopenfilename(
             title=titulo,
-            filetypes=tipos_archivo
+            filetypes=tipos_archivo,
+            **opciones_dialogo
         )
         
         if not ruta_archivo:
@@ -82,18 +112,29 @@ class FileLoader:
                 f"Archivo seleccionado: {ruta_archivo}"
             )
         
+        # Un archivo de 0 bytes se rechaza sin abrirlo con pandas
+        try:
+            tamano = os.path.getsize(ruta_archivo)
+        except OSError as e:
+            raise ErrorCargaArchivo(f"No se pudo acceder al archivo:\n{str(e)}")
+        if tamano == 0:
+            raise ArchivoVacioError(
+                "El archivo está vacío o no contiene datos legibles.\n"
+                "Por favor, verifique que el archivo tenga contenido."
+            )
+        
         try:
             if ruta_lower.endswith('.csv'):
-                df = pd.read_csv(ruta_archivo, encoding='utf-8')
+                df = self._leer_csv(ruta_archivo, 'utf-8', tamano)
             elif ruta_lower.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(ruta_archivo)
+                df = self._leer_excel(ruta_archivo)
             else:
                 raise FormatoNoSoportadoError(
                     f"Formato no soportado: {ruta_archivo}"
                 )
         except UnicodeDecodeError:
             try:
-                df = pd.read_csv(ruta_archivo, encoding='latin-1')
+                df = self._leer_csv(ruta_archivo, 'latin-1', tamano)
             except Exception as e:
                 raise ErrorCargaArchivo(
                     f"Error de codificación al leer el archivo:\n{str(e)}\n\n"
@@ -122,17 +163,73 @@ class FileLoader:
                 "Por favor, verifique que la primera fila contenga los nombres de las columnas."
             )
         
-        columnas_sin_nombre = [col for col in df.columns if str(col).startswith('Unnamed')]
-        if len(columnas_sin_nombre) == len(df.columns):
+        if df.columns.astype(str).str.startswith('Unnamed').all():
             raise ArchivoSinEncabezadosError(
                 "El archivo no tiene encabezados válidos.\n"
                 "Todas las columnas están sin nombre.\n"
                 "Por favor, asegúrese de que la primera fila contenga los nombres de las columnas."
             )
         
+        if self.optimizar_tipos:
+            df = self._optimizar_tipos(df)
+        
         self.ultima_ruta = ruta_archivo
+        self.ultimo_tamano = tamano
+        return df
+    
+    def _leer_csv(self, ruta_archivo: str, encoding: str, tamano: int) -> pd.DataFrame:
+        """
+        Lee un CSV con el motor de pyarrow (multihilo) si está instalado.
+        
+        Si pyarrow no está o falla, se relee con el parser de C de pandas,
+        que es el que produce los errores que maneja cargar_archivo
+        (codificación, archivo vacío). Con archivos grandes ese parser lee
+        por bloques, para que su memoria de trabajo no crezca con el archivo.
+        """
+        if PYARROW_DISPONIBLE:
+            try:
+                return pd.read_csv(ruta_archivo, encoding=encoding, engine='pyarrow')
+            except Exception:
+                pass
+        if tamano > _UMBRAL_CSV_POR_BLOQUES:
+            with pd.read_csv(
+                ruta_archivo, encoding=encoding,
+                chunksize=_FILAS_POR_BLOQUE, low_memory=False
+            ) as lector:
+                return pd.concat(lector, ignore_index=True)
+        return pd.read_csv(ruta_archivo, encoding=encoding)
+    
+    def _leer_excel(self, ruta_archivo: str) -> pd.DataFrame:
+        """Lee un Excel con el lector calamine si está instalado."""
+        if CALAMINE_DISPONIBLE:
+            return pd.read_excel(ruta_archivo, engine='calamine')
+        return pd.read_excel(ruta_archivo)
+    
+    def _optimizar_tipos(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reduce la memoria del DataFrame recién cargado.
+        
+        Las columnas enteras pasan al entero más pequeño que contiene sus
+        valores, y las de texto con menos de la mitad de valores distintos
+        pasan a categóricas. Las columnas decimales se dejan en float64, ya
+        que float32 alteraría los valores que se muestran en la tabla.
+        """
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            if df[col].nunique() < 0.5 * len(df):
+                df[col] = df[col].astype('category')
+        
         return df
     
+    def _validar_dataframe(self, df: pd.DataFrame) -> None:
+        """Verifica que df sea un DataFrame de pandas."""
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError(
+                f"Se esperaba un DataFrame de pandas, pero se recibió: {type(df).__name__}"
+            )
+    
     def obtener_nombre_archivo(self) -> str:
         """Obtiene solo el nombre del archivo de la última ruta cargada."""
         if self.ultima_ruta:
@@ -143,26 +240,29 @@ class FileLoader:
         """
         Obtiene la lista de encabezados (nombres de columnas) de un DataFrame.
         """
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(
-                f"Se esperaba un DataFrame de pandas, pero se recibió: {type(df).__name__}"
-            )
+        self._validar_dataframe(df)
         
         if len(df.columns) == 0:
             raise ArchivoSinEncabezadosError(
                 "El DataFrame no tiene columnas definidas."
             )
         
-        return df.columns.tolist()
+        # Agregar o renombrar columnas reemplaza el Index, así que la entrada
+        # solo se reutiliza si df.columns sigue siendo el mismo objeto
+        clave = id(df)
+        entrada = self._cache_encabezados.get(clave)
+        if entrada is None or entrada[0] is not df.columns:
+            if entrada is None:
+                weakref.finalize(df, self._cache_encabezados.pop, clave, None)
+            entrada = (df.columns, tuple(df.columns.tolist()))
+            self._cache_encabezados[clave] = entrada
+        return list(entrada[1])
     
     def obtener_frecuencias(self, df: pd.DataFrame, columna: str) -> Dict[str, int]:
         """
         Calcula las frecuencias de valores únicos en una columna específica.
         """
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(
-                f"Se esperaba un DataFrame de pandas, pero se recibió: {type(df).__name__}"
-            )
+        self._validar_dataframe(df)
         
         if columna not in df.columns:
             columnas_disponibles = ', '.join(df.columns.tolist())
@@ -171,28 +271,74 @@ class FileLoader:
                 f"Columnas disponibles: {columnas_disponibles}"
             )
         
-        conteo = df[columna].value_counts()
-        frecuencias = conteo.to_dict()
+        serie = df[columna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            # Los códigos ya son enteros 0..k-1 (-1 para nulos): se cuentan
+            # con bincount y se traducen a sus etiquetas al final
+            codigos = serie.cat.codes.to_numpy()
+            conteos = np.bincount(codigos[codigos >= 0], minlength=len(serie.cat.categories))
+            presentes = np.flatnonzero(conteos)
+            etiquetas = serie.cat.categories[presentes].map(str).tolist()
+            return dict(zip(etiquetas, conteos[presentes].tolist()))
+        
+        if pd.api.types.is_integer_dtype(serie):
+            valores = serie.dropna().to_numpy(dtype=np.int64)
+            if valores.size and valores.min() >= 0 and valores.max() < _MAX_VALOR_BINCOUNT:
+                # Enteros pequeños no negativos: un conteo lineal sin hashing
+                conteos = np.bincount(valores)
+                presentes = np.flatnonzero(conteos)
+                return dict(zip(presentes.astype(str).tolist(), conteos[presentes].tolist()))
+        
+        # value_counts descarta los nulos; las claves se pasan a str con
+        # Index.map y los conteos a int de Python con tolist(), sin bucle
+        conteo = serie.value_counts()
+        return dict(zip(conteo.index.map(str).tolist(), conteo.tolist()))
+    
+    def obtener_frecuencias_multi(
+        self, df: pd.DataFrame, columnas: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Calcula las frecuencias de varias columnas a la vez.
         
-        frecuencias_str = {}
-        for clave, valor in frecuencias.items():
-            clave_str = str(clave) if pd.notna(clave) else "NaN (valor nulo)"
-            frecuencias_str[clave_str] = int(valor)
+        Cada columna se cuenta en un hilo aparte; el conteo corre en el código
+        C de pandas/NumPy, así que los hilos avanzan en paralelo. Una columna
+        inexistente lanza ColumnaNoEncontradaError igual que obtener_frecuencias.
+        """
+        columnas = list(columnas)
+        if len(columnas) <= 1:
+            return {col: self.obtener_frecuencias(df, col) for col in columnas}
         
-        return frecuencias_str
+        hilos = min(len(columnas), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=hilos) as executor:
+            resultados = executor.map(lambda col: self.obtener_frecuencias(df, col), columnas)
+            return dict(zip(columnas, resultados))
     
     def obtener_resumen_datos(self, df: pd.DataFrame) -> Dict:
         """
         Genera un resumen general de los datos cargados.
         """
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError(
-                f"Se esperaba un DataFrame de pandas, pero se recibió: {type(df).__name__}"
-            )
+        self._validar_dataframe(df)
+        
+        # La entrada se reutiliza mientras df conserve su forma y su Index de
+        # columnas y no se haya cargado otro archivo
+        clave = id(df)
+        entrada = self._cache_resumen.get(clave)
+        if entrada is not None and (
+            entrada[0] == df.shape
+            and entrada[1] is df.columns
+            and entrada[2] == self.ultima_ruta
+        ):
+            resumen = entrada[3]
+        else:
+            if entrada is None:
+                weakref.finalize(df, self._cache_resumen.pop, clave, None)
+            resumen = {
+                'filas': len(df),
+                'columnas': len(df.columns),
+                'encabezados': df.columns.tolist(),
+                'ultima_ruta': self.ultima_ruta
+            }
+            self._cache_resumen[clave] = (df.shape, df.columns, self.ultima_ruta, resumen)
         
-        return {
-            'filas': len(df),
-            'columnas': len(df.columns),
-            'encabezados': self.obtener_encabezados(df),
-            'ultima_ruta': self.ultima_ruta
-        }
+        # Copia para que el llamador pueda modificar el resultado sin tocar el caché
+        return {**resumen, 'encabezados': list(resumen['encabezados'])}
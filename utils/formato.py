@@ -3,6 +3,43 @@ Módulo para formatear y presentar resultados
 Mejorada la presentación con información sobre población infinita
 """
 
+import io
+import math
+from fractions import Fraction
+
+import numpy as np
+
+# Bordes y separadores comunes a todos los reportes
+_MARCO_SUPERIOR = "╔" + "═" * 56 + "╗\n"
+_MARCO_INFERIOR = "╚" + "═" * 56 + "╝\n\n"
+_SEPARADOR = "─" * 58 + "\n"
+# Barra más larga de la tabla de probabilidades; cada fila toma un prefijo
+_BARRA_COMPLETA = "█" * 67
+
+
+def _filas_probabilidades(valores_x, probs):
+    """
+    Arma todas las filas de la tabla de probabilidades en una sola
+    comprensión y las une una vez
+    
+    Args:
+        valores_x (list): Lista de valores de X
+        probs (np.ndarray): Probabilidad de cada valor de X, en float64
+        
+    Returns:
+        str: Filas con P(X=x), porcentaje y barra visual, cada una con salto de línea
+    """
+    porcentajes = probs * 100
+    # Un carácter por cada 1.5 %, hasta 67, calculado para todas las filas a la vez
+    longitudes = np.where(porcentajes <= 100, porcentajes / 1.5, 67).astype(np.int64)
+    filas = [
+        f"   P(X={x:2d})    {prob:.8f}    {porcentaje:6.3f}%     {_BARRA_COMPLETA[:longitud]}\n"
+        for x, prob, porcentaje, longitud in zip(
+            valores_x, probs.tolist(), porcentajes.tolist(), longitudes.tolist()
+        )
+    ]
+    return "".join(filas)
+
 
 def generar_texto_resultados(n, p, valores_x, probabilidades, media, desviacion, 
                                N=None, factor_correccion=None, sesgo=None, 
@@ -14,85 +51,82 @@ def generar_texto_resultados(n, p, valores_x, probabilidades, media, desviacion,
     """
     q = 1 - p
     varianza = desviacion ** 2
-    es_infinita = (N is None) or (n <= 0.05 * N)
+    es_infinita = (N is None) or (20 * n <= N)
     
-    resultado = "╔" + "═" * 56 + "╗\n"
-    resultado += "║" + " " * 10 + "RESULTADOS DEL CÁLCULO" + " " * 20 + "║\n"
-    resultado += "╚" + "═" * 56 + "╝\n\n"
+    buf = io.StringIO()
+    
+    buf.write(_MARCO_SUPERIOR)
+    buf.write("║" + " " * 10 + "RESULTADOS DEL CÁLCULO" + " " * 20 + "║\n")
+    buf.write(_MARCO_INFERIOR)
     
     # Información de población
-    resultado += "TIPO DE POBLACIÓN\n"
-    resultado += "─" * 58 + "\n"
+    buf.write("TIPO DE POBLACIÓN\n")
+    buf.write(_SEPARADOR)
     if N is None:
-        resultado += f"   • Tipo: INFINITA (no se especificó población)\n"
+        buf.write(f"   • Tipo: INFINITA (no se especificó población)\n")
     elif es_infinita:
-        resultado += f"   • Tipo: INFINITA (muestra ≤ 5% de población)\n"
-        resultado += f"   • Población (N): {N}\n"
-        resultado += f"   • Proporción muestra/población: {(n/N)*100:.2f}%\n"
+        buf.write(f"   • Tipo: INFINITA (muestra ≤ 5% de población)\n")
+        buf.write(f"   • Población (N): {N}\n")
+        buf.write(f"   • Proporción muestra/población: {(n/N)*100:.2f}%\n")
     else:
-        resultado += f"   • Tipo: FINITA (muestra > 5% de población)\n"
-        resultado += f"   • Población (N): {N}\n"
-        resultado += f"   • Proporción muestra/población: {(n/N)*100:.2f}%\n"
+        buf.write(f"   • Tipo: FINITA (muestra > 5% de población)\n")
+        buf.write(f"   • Población (N): {N}\n")
+        buf.write(f"   • Proporción muestra/población: {(n/N)*100:.2f}%\n")
         if factor_correccion is not None:
-            resultado += f"   • Factor de corrección (FPC): {factor_correccion:.6f}\n"
-    resultado += "\n"
+            buf.write(f"   • Factor de corrección (FPC): {factor_correccion:.6f}\n")
+    buf.write("\n")
     
     # Parámetros
-    resultado += "PARÁMETROS DE LA DISTRIBUCIÓN\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • Tamaño de muestra (n): {n}\n"
-    resultado += f"   • Probabilidad de éxito (p): {p:.6f}\n"
-    resultado += f"   • Probabilidad de fracaso (q): {q:.6f}\n\n"
+    buf.write("PARÁMETROS DE LA DISTRIBUCIÓN\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • Tamaño de muestra (n): {n}\n")
+    buf.write(f"   • Probabilidad de éxito (p): {p:.6f}\n")
+    buf.write(f"   • Probabilidad de fracaso (q): {q:.6f}\n\n")
     
     # Estadísticas
-    resultado += "ESTADÍSTICAS\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • Media (μ = n × p): {media:.6f}\n"
+    buf.write("ESTADÍSTICAS\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • Media (μ = n × p): {media:.6f}\n")
     if not es_infinita and N is not None:
-        resultado += f"   • Varianza (σ² = n × p × q × FPC²): {varianza:.6f}\n"
-        resultado += f"   • Desviación estándar (σ = √(n × p × q) × FPC): {desviacion:.6f}\n"
+        buf.write(f"   • Varianza (σ² = n × p × q × FPC²): {varianza:.6f}\n")
+        buf.write(f"   • Desviación estándar (σ = √(n × p × q) × FPC): {desviacion:.6f}\n")
     else:
-        resultado += f"   • Varianza (σ² = n × p × q): {varianza:.6f}\n"
-        resultado += f"   • Desviación estándar (σ = √(n × p × q)): {desviacion:.6f}\n"
-    resultado += f"   • Coeficiente de variación: {(desviacion/media)*100:.2f}%\n\n"
+        buf.write(f"   • Varianza (σ² = n × p × q): {varianza:.6f}\n")
+        buf.write(f"   • Desviación estándar (σ = √(n × p × q)): {desviacion:.6f}\n")
+    buf.write(f"   • Coeficiente de variación: {(desviacion/media)*100:.2f}%\n\n")
     
     # Sesgo y Curtosis
     if sesgo is not None and curtosis is not None:
-        resultado += "FORMA DE LA DISTRIBUCIÓN\n"
-        resultado += "─" * 58 + "\n"
-        resultado += f"   • Sesgo (Asimetría): {sesgo:.6f}\n"
-        resultado += f"   • Interpretación: {interpretacion_sesgo}\n"
-        resultado += f"   • Curtosis: {curtosis:.6f}\n"
-        resultado += f"   • Interpretación: {interpretacion_curtosis}\n\n"
+        buf.write("FORMA DE LA DISTRIBUCIÓN\n")
+        buf.write(_SEPARADOR)
+        buf.write(f"   • Sesgo (Asimetría): {sesgo:.6f}\n")
+        buf.write(f"   • Interpretación: {interpretacion_sesgo}\n")
+        buf.write(f"   • Curtosis: {curtosis:.6f}\n")
+        buf.write(f"   • Interpretación: {interpretacion_curtosis}\n\n")
     
     # Probabilidades individuales
-    resultado += "PROBABILIDADES CALCULADAS\n"
-    resultado += "─" * 58 + "\n"
-    resultado += "   Valores   Probabilidad    Porcentaje     Visual\n"
-    resultado += "─" * 58 + "\n"
-    
-    for x, prob in zip(valores_x, probabilidades):
-        porcentaje = prob * 100
-        # Crear barra visual mejorada
-        barra_length = int(porcentaje / 1.5) if porcentaje <= 100 else 67
-        barra = "█" * barra_length
-        
-        # Formatear valores
-        resultado += f"   P(X={x:2d})    {prob:.8f}    {porcentaje:6.3f}%     {barra}\n"
+    buf.write("PROBABILIDADES CALCULADAS\n")
+    buf.write(_SEPARADOR)
+    buf.write("   Valores   Probabilidad    Porcentaje     Visual\n")
+    buf.write(_SEPARADOR)
     
-    resultado += "─" * 58 + "\n"
+    probs = np.asarray(probabilidades, dtype=np.float64)
+    buf.write(_filas_probabilidades(valores_x, probs))
+    
+    buf.write(_SEPARADOR)
     
     # Resumen de probabilidades
-    suma_prob = sum(probabilidades)
-    resultado += f"\nSuma de probabilidades calculadas: {suma_prob:.10f}\n"
+    suma_prob = math.fsum(probs.tolist())
+    buf.write(f"\nSuma de probabilidades calculadas: {suma_prob:.10f}\n")
     
     # Probabilidad máxima
-    prob_max = max(probabilidades)
-    x_max = valores_x[probabilidades.index(prob_max)]
-    resultado += f"Probabilidad máxima: P(X={x_max}) = {prob_max:.8f} ({prob_max*100:.3f}%)\n"
+    i_max = int(probs.argmax())
+    prob_max = float(probs[i_max])
+    x_max = valores_x[i_max]
+    buf.write(f"Probabilidad máxima: P(X={x_max}) = {prob_max:.8f} ({prob_max*100:.3f}%)\n")
     
     
-    return resultado
+    return buf.getvalue()
 
 
 def calcular_moda(n, p):
@@ -103,18 +137,29 @@ def calcular_moda(n, p):
     
     Args:
         n (int): Número de ensayos
-        p (float): Probabilidad de éxito
+        p (float | Fraction): Probabilidad de éxito; con una Fraction el
+            caso de dos modas se decide con aritmética entera exacta
         
     Returns:
         int or str: Moda de la distribución
     """
-    if (n + 1) * p == int((n + 1) * p):
-        # Dos modas
-        k = int((n + 1) * p)
-        return f"{k-1} y {k}"
+    valor = (n + 1) * p
+    if isinstance(valor, Fraction):
+        k = valor.numerator
+        es_entero = valor.denominator == 1
     else:
+        # (n+1)·p en coma flotante puede quedar a un ulp de un entero
+        k = round(valor)
+        es_entero = math.isclose(valor, k, rel_tol=0, abs_tol=1e-9)
+    
+    if not es_entero:
         # Una moda
-        return int((n + 1) * p)
+        return math.floor(valor)
+    if k == 0 or k == n + 1:
+        # p = 0 o p = 1: la única moda es 0 o n
+        return min(k, n)
+    # Dos modas
+    return f"{k-1} y {k}"
 
 
 def generar_resumen_corto(n, p, media, desviacion, N=None):
@@ -131,7 +176,7 @@ def generar_resumen_corto(n, p, media, desviacion, N=None):
     Returns:
         str: Resumen corto
     """
-    poblacion_tipo = "Infinita" if N is None or n <= 0.05 * N else f"Finita(N={N})"
+    poblacion_tipo = "Infinita" if N is None or 20 * n <= N else f"Finita(N={N})"
     return (f"Binomial(n={n}, p={p:.4f}) | "
             f"μ={media:.4f} | σ={desviacion:.4f} | "
             f"{poblacion_tipo}")
@@ -171,74 +216,74 @@ def generar_texto_resultados_hipergeometrica(n, N, K, valores_x, probabilidades,
     p = K / N if N > 0 else 0
     q = 1 - p
     
-    resultado = "╔" + "═" * 56 + "╗\n"
-    resultado += "║" + " " * 6 + "RESULTADOS - DISTRIBUCIÓN HIPERGEOMÉTRICA" + " " * 6 + "║\n"
-    resultado += "╚" + "═" * 56 + "╝\n\n"
+    buf = io.StringIO()
+    
+    buf.write(_MARCO_SUPERIOR)
+    buf.write("║" + " " * 6 + "RESULTADOS - DISTRIBUCIÓN HIPERGEOMÉTRICA" + " " * 6 + "║\n")
+    buf.write(_MARCO_INFERIOR)
     
-    resultado += "CONDICIÓN DE APLICABILIDAD\n"
-    resultado += "─" * 58 + "\n"
+    buf.write("CONDICIÓN DE APLICABILIDAD\n")
+    buf.write(_SEPARADOR)
     if cumple_condicion:
-        resultado += f"   ✓ VÁLIDO: La muestra representa {porcentaje_muestra:.2f}% de la población\n"
-        resultado += "   (≥ 20%) - Se puede usar distribución hipergeométrica\n"
+        buf.write(f"   ✓ VÁLIDO: La muestra representa {porcentaje_muestra:.2f}% de la población\n")
+        buf.write("   (≥ 20%) - Se puede usar distribución hipergeométrica\n")
     else:
-        resultado += f"   ✗ ADVERTENCIA: La muestra representa {porcentaje_muestra:.2f}% de la población\n"
-        resultado += "   (< 20%) - Se recomienda usar distribución BINOMIAL\n\n"
-        resultado += "   La distribución hipergeométrica es apropiada cuando\n"
-        resultado += "   la muestra es grande respecto a la población.\n"
-    resultado += "\n"
-    
-    resultado += "PARÁMETROS DE LA DISTRIBUCIÓN\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • Población total (N): {N}\n"
-    resultado += f"   • Éxitos en población (K): {K}\n"
-    resultado += f"   • Tamaño de muestra (n): {n}\n"
-    resultado += f"   • Probabilidad implícita (p = K/N): {p:.6f}\n"
-    resultado += f"   • Probabilidad implícita (q = 1-p): {q:.6f}\n\n"
-    
-    resultado += "ESTADÍSTICAS\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • Media (μ = nK/N): {media:.6f}\n"
-    resultado += f"   • Varianza (σ²): {varianza:.6f}\n"
-    resultado += f"   • Desviación estándar (σ): {desviacion:.6f}\n"
-    resultado += f"   • Coeficiente de variación: {(desviacion/media)*100:.2f}%\n" if media > 0 else "   • Coeficiente de variación: N/A\n"
+        buf.write(f"   ✗ ADVERTENCIA: La muestra representa {porcentaje_muestra:.2f}% de la población\n")
+        buf.write("   (< 20%) - Se recomienda usar distribución BINOMIAL\n\n")
+        buf.write("   La distribución hipergeométrica es apropiada cuando\n")
+        buf.write("   la muestra es grande respecto a la población.\n")
+    buf.write("\n")
+    
+    buf.write("PARÁMETROS DE LA DISTRIBUCIÓN\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • Población total (N): {N}\n")
+    buf.write(f"   • Éxitos en población (K): {K}\n")
+    buf.write(f"   • Tamaño de muestra (n): {n}\n")
+    buf.write(f"   • Probabilidad implícita (p = K/N): {p:.6f}\n")
+    buf.write(f"   • Probabilidad implícita (q = 1-p): {q:.6f}\n\n")
+    
+    buf.write("ESTADÍSTICAS\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • Media (μ = nK/N): {media:.6f}\n")
+    buf.write(f"   • Varianza (σ²): {varianza:.6f}\n")
+    buf.write(f"   • Desviación estándar (σ): {desviacion:.6f}\n")
+    buf.write(f"   • Coeficiente de variación: {(desviacion/media)*100:.2f}%\n" if media > 0 else "   • Coeficiente de variación: N/A\n")
     
     if mediana is not None:
-        resultado += f"   • Mediana: {mediana}\n"
-    resultado += "\n"
+        buf.write(f"   • Mediana: {mediana}\n")
+    buf.write("\n")
     
     if sesgo is not None:
-        resultado += "FORMA DE LA DISTRIBUCIÓN\n"
-        resultado += "─" * 58 + "\n"
-        resultado += f"   • Sesgo (Asimetría): {sesgo:.6f}\n"
-        resultado += f"   • Interpretación: {interpretacion_sesgo}\n"
+        buf.write("FORMA DE LA DISTRIBUCIÓN\n")
+        buf.write(_SEPARADOR)
+        buf.write(f"   • Sesgo (Asimetría): {sesgo:.6f}\n")
+        buf.write(f"   • Interpretación: {interpretacion_sesgo}\n")
         if tipo_sesgo_media_mediana:
-            resultado += f"   • Tipo por media vs mediana: {tipo_sesgo_media_mediana}\n"
+            buf.write(f"   • Tipo por media vs mediana: {tipo_sesgo_media_mediana}\n")
         if curtosis is not None:
-            resultado += f"   • Curtosis: {curtosis:.6f}\n"
-            resultado += f"   • Interpretación: {interpretacion_curtosis}\n"
-        resultado += "\n"
+            buf.write(f"   • Curtosis: {curtosis:.6f}\n")
+            buf.write(f"   • Interpretación: {interpretacion_curtosis}\n")
+        buf.write("\n")
     
-    resultado += "PROBABILIDADES CALCULADAS\n"
-    resultado += "─" * 58 + "\n"
-    resultado += "   Valores   Probabilidad    Porcentaje     Visual\n"
-    resultado += "─" * 58 + "\n"
+    buf.write("PROBABILIDADES CALCULADAS\n")
+    buf.write(_SEPARADOR)
+    buf.write("   Valores   Probabilidad    Porcentaje     Visual\n")
+    buf.write(_SEPARADOR)
     
-    for x, prob in zip(valores_x, probabilidades):
-        porcentaje = prob * 100
-        barra_length = int(porcentaje / 1.5) if porcentaje <= 100 else 67
-        barra = "█" * barra_length
-        resultado += f"   P(X={x:2d})    {prob:.8f}    {porcentaje:6.3f}%     {barra}\n"
+    probs = np.asarray(probabilidades, dtype=np.float64)
+    buf.write(_filas_probabilidades(valores_x, probs))
     
-    resultado += "─" * 58 + "\n"
+    buf.write(_SEPARADOR)
     
-    suma_prob = sum(probabilidades)
-    resultado += f"\nSuma de probabilidades calculadas: {suma_prob:.10f}\n"
+    suma_prob = math.fsum(probs.tolist())
+    buf.write(f"\nSuma de probabilidades calculadas: {suma_prob:.10f}\n")
     
-    prob_max = max(probabilidades)
-    x_max = valores_x[probabilidades.index(prob_max)]
-    resultado += f"Probabilidad máxima: P(X={x_max}) = {prob_max:.8f} ({prob_max*100:.3f}%)\n"
+    i_max = int(probs.argmax())
+    prob_max = float(probs[i_max])
+    x_max = valores_x[i_max]
+    buf.write(f"Probabilidad máxima: P(X={x_max}) = {prob_max:.8f} ({prob_max*100:.3f}%)\n")
     
-    return resultado
+    return buf.getvalue()
 
 
 def generar_mensaje_usar_binomial(n, N, K, porcentaje):
@@ -254,31 +299,32 @@ def generar_mensaje_usar_binomial(n, N, K, porcentaje):
     Returns:
         str: Mensaje formateado
     """
-    resultado = "╔" + "═" * 56 + "╗\n"
-    resultado += "║" + " " * 12 + "USAR DISTRIBUCIÓN BINOMIAL" + " " * 14 + "║\n"
-    resultado += "╚" + "═" * 56 + "╝\n\n"
-    
-    resultado += "ANÁLISIS DE CONDICIONES\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • Tamaño de población (N): {N}\n"
-    resultado += f"   • Tamaño de muestra (n): {n}\n"
-    resultado += f"   • Porcentaje de muestra: {porcentaje:.2f}%\n\n"
-    
-    resultado += "CONCLUSIÓN\n"
-    resultado += "─" * 58 + "\n"
-    resultado += "   La muestra representa menos del 20% de la población.\n"
-    resultado += "   Por lo tanto, se DEBE resolver mediante DISTRIBUCIÓN\n"
-    resultado += "   BINOMIAL en lugar de Hipergeométrica.\n\n"
-    
-    resultado += "   Razón: Cuando la muestra es pequeña respecto a la\n"
-    resultado += "   población (< 20%), el muestreo sin reemplazo se\n"
-    resultado += "   aproxima bien al muestreo con reemplazo (binomial).\n\n"
+    buf = io.StringIO()
+    buf.write(_MARCO_SUPERIOR)
+    buf.write("║" + " " * 12 + "USAR DISTRIBUCIÓN BINOMIAL" + " " * 14 + "║\n")
+    buf.write(_MARCO_INFERIOR)
+    
+    buf.write("ANÁLISIS DE CONDICIONES\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • Tamaño de población (N): {N}\n")
+    buf.write(f"   • Tamaño de muestra (n): {n}\n")
+    buf.write(f"   • Porcentaje de muestra: {porcentaje:.2f}%\n\n")
+    
+    buf.write("CONCLUSIÓN\n")
+    buf.write(_SEPARADOR)
+    buf.write("   La muestra representa menos del 20% de la población.\n")
+    buf.write("   Por lo tanto, se DEBE resolver mediante DISTRIBUCIÓN\n")
+    buf.write("   BINOMIAL en lugar de Hipergeométrica.\n\n")
+    
+    buf.write("   Razón: Cuando la muestra es pequeña respecto a la\n")
+    buf.write("   población (< 20%), el muestreo sin reemplazo se\n")
+    buf.write("   aproxima bien al muestreo con reemplazo (binomial).\n\n")
     
     p = K / N if N > 0 else 0
-    resultado += "PARÁMETROS PARA BINOMIAL\n"
-    resultado += "─" * 58 + "\n"
-    resultado += f"   • n = {n} (tamaño de muestra)\n"
-    resultado += f"   • p = {p:.6f} (K/N = {K}/{N})\n"
+    buf.write("PARÁMETROS PARA BINOMIAL\n")
+    buf.write(_SEPARADOR)
+    buf.write(f"   • n = {n} (tamaño de muestra)\n")
+    buf.write(f"   • p = {p:.6f} (K/N = {K}/{N})\n")
     
-    return resultado
+    return buf.getvalue()
 
@@ -4,6 +4,17 @@ Módulo de validación de datos de entrada
 
 import math
 
+import numpy as np
+
+# Plantillas de los mensajes que repiten los validadores binomial,
+# hipergeométrico y de Poisson
+_MSG_X_NEGATIVO = "El valor X={x} no puede ser negativo"
+_MSG_X_MAYOR_QUE_N = (
+    "El valor X={x} no puede ser mayor que el tamaño de la muestra (n={n})"
+)
+_MSG_TOLERANCIA_RANGO = "La tolerancia debe estar entre 0 y 100"
+_MSG_TOLERANCIA_INVALIDA = "La tolerancia debe ser un número válido"
+
 
 def normalizar_probabilidad(valor):
     """
@@ -101,9 +112,9 @@ def validar_parametros_comparacion(n, p, N, tolerancia, K=None):
         try:
             tol = float(tolerancia)
             if tol < 0 or tol > 100:
-                return False, "La tolerancia debe estar entre 0 y 100"
+                return False, _MSG_TOLERANCIA_RANGO
         except (ValueError, TypeError):
-            return False, "La tolerancia debe ser un número válido"
+            return False, _MSG_TOLERANCIA_INVALIDA
     return True, ""
 
 
@@ -123,10 +134,33 @@ def validar_tolerancia(tolerancia):
     try:
         tol = float(tolerancia)
         if tol < 0 or tol > 100:
-            return False, None, "La tolerancia debe estar entre 0 y 100"
+            return False, None, _MSG_TOLERANCIA_RANGO
         return True, tol, ""
     except (ValueError, TypeError):
-        return False, None, "La tolerancia debe ser un número válido"
+        return False, None, _MSG_TOLERANCIA_INVALIDA
+
+
+def _primer_fuera_de_rango(valores_x, maximo):
+    """
+    Busca con una sola comparación vectorizada el primer valor de X fuera
+    de 0..maximo
+
+    Args:
+        valores_x (list): Lista de valores de X
+        maximo (int): Mayor valor de X permitido
+
+    Returns:
+        int | None: El primer valor inválido, o None si todos son válidos
+    """
+    try:
+        arr = np.asarray(valores_x, dtype=np.int64)
+    except OverflowError:
+        # Algún X no cabe en int64: se recorre con enteros de Python
+        return next((x for x in valores_x if x < 0 or x > maximo), None)
+    fuera = (arr < 0) | (arr > maximo)
+    if not fuera.any():
+        return None
+    return int(arr[np.argmax(fuera)])
 
 
 def validar_valores_x(valores_x, n):
@@ -140,16 +174,12 @@ def validar_valores_x(valores_x, n):
     Returns:
         tuple: (es_valido, mensaje_error)
     """
-    for x in valores_x:
-        if x < 0:
-            return False, f"El valor X={x} no puede ser negativo"
-        if x > n:
-            return (
-                False,
-                f"El valor X={x} no puede ser mayor que el tamaño de la muestra (n={n})",
-            )
-
-    return True, ""
+    x = _primer_fuera_de_rango(valores_x, n)
+    if x is None:
+        return True, ""
+    if x < 0:
+        return False, _MSG_X_NEGATIVO.format(x=x)
+    return False, _MSG_X_MAYOR_QUE_N.format(x=x, n=n)
 
 
 def parsear_valores_x(texto, n):
@@ -163,9 +193,9 @@ def parsear_valores_x(texto, n):
     Returns:
         list: Lista de valores enteros de X
     """
-    texto = texto.strip().lower()
+    texto = texto.strip()
 
-    if texto == "todos" or texto == "":
+    if not texto or texto.lower() == "todos":
         return list(range(0, n + 1))
 
     if "," not in texto:
@@ -177,8 +207,28 @@ def parsear_valores_x(texto, n):
         except ValueError:
             return [0]
 
-    valores_x = [int(x.strip()) for x in texto.split(",")]
-    return valores_x
+    # int() ya ignora los espacios alrededor de cada número
+    return list(map(int, texto.split(",")))
+
+
+def parsear_y_validar_valores_x(texto, n):
+    """
+    Parsea y valida los valores de X en un solo paso
+    "todos", el texto vacío o un solo número generan el rango 0..m, así que
+    basta revisar el valor n+1; una lista separada por comas se valida entera
+
+    Args:
+        texto (str): Texto con valores separados por coma, "todos", o un solo número
+        n (int): Tamaño de muestra
+
+    Returns:
+        tuple: (valores_x, es_valido, mensaje_error)
+    """
+    valores_x = parsear_valores_x(texto, n)
+    # En el rango 0..m el único candidato a primer valor inválido es n+1
+    revisar = valores_x if "," in texto else valores_x[n + 1:n + 2]
+    valido, mensaje = validar_valores_x(revisar, n)
+    return valores_x, valido, mensaje
 
 
 def validar_parametros_hipergeometrica(n, N, K):
@@ -220,7 +270,7 @@ def validar_parametros_hipergeometrica(n, N, K):
     return True, ""
 
 
-def validar_valores_x_hipergeometrica(valores_x, n, K):
+def validar_valores_x_hipergeometrica(valores_x, n, K, max_x=None):
     """
     Valida que los valores de X estén dentro del rango válido para hipergeométrica
 
@@ -230,30 +280,28 @@ def validar_valores_x_hipergeometrica(valores_x, n, K):
         valores_x (list): Lista de valores de X
         n (int): Tamaño de muestra
         K (int): Número de éxitos en población
+        max_x (int, optional): min(n, K) ya calculado por quien llama
 
     Returns:
         tuple: (es_valido, mensaje_error)
     """
-    max_x = min(n, K)
-
-    for x in valores_x:
-        if x < 0:
-            return False, f"El valor X={x} no puede ser negativo"
-        if x > n:
-            return (
-                False,
-                f"El valor X={x} no puede ser mayor que el tamaño de la muestra (n={n})",
-            )
-        if x > max_x:
-            return (
-                False,
-                f"El valor X={x} excede el máximo posible ({max_x} = min(n={n}, K={K}))",
-            )
-
-    return True, ""
-
-
-def parsear_valores_x_hipergeometrica(texto, n, K):
+    if max_x is None:
+        max_x = min(n, K)
+
+    x = _primer_fuera_de_rango(valores_x, max_x)
+    if x is None:
+        return True, ""
+    if x < 0:
+        return False, _MSG_X_NEGATIVO.format(x=x)
+    if x > n:
+        return False, _MSG_X_MAYOR_QUE_N.format(x=x, n=n)
+    return (
+        False,
+        f"El valor X={x} excede el máximo posible ({max_x} = min(n={n}, K={K}))",
+    )
+
+
+def parsear_valores_x_hipergeometrica(texto, n, K, max_x=None):
     """
     Parsea el texto de entrada de valores X para hipergeométrica
 
@@ -261,14 +309,16 @@ def parsear_valores_x_hipergeometrica(texto, n, K):
         texto (str): Texto con valores separados por coma, "todos", o un solo número
         n (int): Tamaño de muestra
         K (int): Éxitos en población
+        max_x (int, optional): min(n, K) ya calculado por quien llama
 
     Returns:
         list: Lista de valores enteros de X
     """
-    max_x = min(n, K)
-    texto = texto.strip().lower()
+    if max_x is None:
+        max_x = min(n, K)
+    texto = texto.strip()
 
-    if texto == "todos" or texto == "":
+    if not texto or texto.lower() == "todos":
         return list(range(0, max_x + 1))
 
     if "," not in texto:
@@ -280,8 +330,28 @@ def parsear_valores_x_hipergeometrica(texto, n, K):
         except ValueError:
             return [0]
 
-    valores_x = [int(x.strip()) for x in texto.split(",")]
-    return valores_x
+    # int() ya ignora los espacios alrededor de cada número
+    return list(map(int, texto.split(",")))
+
+
+def parsear_y_validar_valores_x_hipergeometrica(texto, n, K):
+    """
+    Parsea y valida los valores de X para hipergeométrica en un solo paso,
+    revisando solo el valor min(n, K)+1 cuando el texto genera un rango 0..m
+
+    Args:
+        texto (str): Texto con valores separados por coma, "todos", o un solo número
+        n (int): Tamaño de muestra
+        K (int): Éxitos en población
+
+    Returns:
+        tuple: (valores_x, es_valido, mensaje_error)
+    """
+    max_x = min(n, K)
+    valores_x = parsear_valores_x_hipergeometrica(texto, n, K, max_x)
+    revisar = valores_x if "," in texto else valores_x[max_x + 1:max_x + 2]
+    valido, mensaje = validar_valores_x_hipergeometrica(revisar, n, K, max_x)
+    return valores_x, valido, mensaje
 
 
 def validar_condiciones_poisson(n: int, p: float) -> tuple[bool, str, float]:
@@ -332,9 +402,9 @@ def parsear_valores_x_poisson(texto: str, lam: float, n: int) -> list[int]:
     Returns:
         list: Lista de valores enteros de X (ningún valor puede exceder n)
     """
-    texto = texto.strip().lower()
+    texto = texto.strip()
 
-    if texto == "todos" or texto == "":
+    if not texto or texto.lower() == "todos":
         return list(range(0, n + 1))
 
     if "," not in texto:
@@ -363,11 +433,8 @@ def validar_valores_x_poisson(valores_x: list[int], n: int) -> tuple[bool, str]:
     """
     for x in valores_x:
         if x > n:
-            return (
-                False,
-                f"El valor X={x} no puede ser mayor que el tamaño de la muestra (n={n})",
-            )
+            return False, _MSG_X_MAYOR_QUE_N.format(x=x, n=n)
         if x < 0:
-            return False, f"El valor X={x} no puede ser negativo"
+            return False, _MSG_X_NEGATIVO.format(x=x)
 
     return True, ""
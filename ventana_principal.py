@@ -3,6 +3,7 @@ Ventana principal de la aplicación de distribución binomial
 Diseño mejorado y centrado
 """
 import re
+import sys
 
 import customtkinter as ctk
 from tkinter import messagebox
@@ -13,12 +14,9 @@ from utils import (
     calcular_media,
     calcular_desviacion_estandar,
     validar_parametros,
-    validar_valores_x,
-    parsear_valores_x,
+    parsear_y_validar_valores_x,
     es_poblacion_infinita,
-    calcular_factor_correccion,
-    calcular_sesgo,
-    calcular_curtosis,
+    calcular_estadisticas,
     calcular_probabilidades_acumuladas,
     buscar_valor_tolerancia,
     validar_parametros_comparacion,
@@ -35,20 +33,16 @@ from utils.calculos import (
     cumple_condicion_hipergeometrica,
     calcular_media_hipergeometrica,
     calcular_desviacion_hipergeometrica,
-    calcular_sesgo_hipergeometrica,
-    calcular_curtosis_hipergeometrica,
+    calcular_estadisticas_hipergeometrica,
     calcular_probabilidades_hipergeometrica,
     calcular_probabilidades_acumuladas_hipergeometrica,
     calcular_mediana_hipergeometrica,
-    determinar_tipo_sesgo,
 )
 from utils.validaciones import (
     validar_parametros_hipergeometrica,
-    validar_valores_x_hipergeometrica,
-    parsear_valores_x_hipergeometrica,
+    parsear_y_validar_valores_x_hipergeometrica,
     normalizar_probabilidad,
 )
-from utils.formato import generar_mensaje_usar_binomial
 from utils.mm1_queue import MM1Queue
 from data_viewer import DataViewerWindow
 from db_connector import DatabaseConfigError, DatabaseQueryError, Super24DBConnector
@@ -114,9 +108,10 @@ class VentanaPrincipal:
                 if self.dashboard.grafico:
                     self.dashboard.grafico.limpiar()
 
-            import matplotlib.pyplot as plt
-
-            plt.close("all")
+            # Solo hay figuras que cerrar si pyplot llegó a importarse
+            plt = sys.modules.get("matplotlib.pyplot")
+            if plt is not None:
+                plt.close("all")
 
         except Exception:
             pass
@@ -125,16 +120,17 @@ class VentanaPrincipal:
 
     def calcular_desde_dashboard(self):
         """Procesa los datos y realiza los cálculos desde el dashboard"""
+        dashboard = self.dashboard
         try:
-            valores = self.dashboard.obtener_campos()
+            valores = dashboard.obtener_campos()
 
             if not valores:
                 return
 
             # Check if Poisson approximation is activated
             if (
-                hasattr(self.dashboard.campos, "chk_poisson")
-                and self.dashboard.campos.chk_poisson.get()
+                hasattr(dashboard.campos, "chk_poisson")
+                and dashboard.campos.chk_poisson.get()
             ):
                 self.calcular_poisson_binomial()
                 return
@@ -231,8 +227,7 @@ class VentanaPrincipal:
                     messagebox.showerror("Error de Validación", mensaje)
                     return
 
-                valores_x = parsear_valores_x(valores["x"], n)
-                valido, mensaje = validar_valores_x(valores_x, n)
+                valores_x, valido, mensaje = parsear_y_validar_valores_x(valores["x"], n)
                 if not valido:
                     messagebox.showerror("Error de Validación", mensaje)
                     return
@@ -256,25 +251,15 @@ class VentanaPrincipal:
                 messagebox.showerror("Error de Validación", mensaje)
                 return
 
-            valores_x = parsear_valores_x(valores["x"], n)
-
-            valido, mensaje = validar_valores_x(valores_x, n)
+            valores_x, valido, mensaje = parsear_y_validar_valores_x(valores["x"], n)
             if not valido:
                 messagebox.showerror("Error de Validación", mensaje)
                 return
 
             es_infinita = es_poblacion_infinita(n, N)
 
-            factor_correccion = None
-            if not es_infinita and N is not None:
-                factor_correccion = calcular_factor_correccion(n, N)
-
             probabilidades = calcular_probabilidades(valores_x, n, p)
-            media = calcular_media(n, p)
-            desviacion = calcular_desviacion_estandar(n, p, N)
-
-            sesgo, interpretacion_sesgo = calcular_sesgo(n, p, N)
-            curtosis, interpretacion_curtosis = calcular_curtosis(n, p, N)
+            estadisticas = calcular_estadisticas(n, p, N)
 
             datos_resultados = {
                 "n": n,
@@ -282,22 +267,22 @@ class VentanaPrincipal:
                 "N": N,
                 "valores_x": valores_x,
                 "probabilidades": probabilidades,
-                "media": media,
-                "desviacion": desviacion,
-                "factor_correccion": factor_correccion,
-                "sesgo": sesgo,
-                "interpretacion_sesgo": interpretacion_sesgo,
-                "curtosis": curtosis,
-                "interpretacion_curtosis": interpretacion_curtosis,
+                "media": estadisticas["media"],
+                "desviacion": estadisticas["desviacion"],
+                "factor_correccion": estadisticas["factor_correccion"],
+                "sesgo": estadisticas["sesgo"],
+                "interpretacion_sesgo": estadisticas["interpretacion_sesgo"],
+                "curtosis": estadisticas["curtosis"],
+                "interpretacion_curtosis": estadisticas["interpretacion_curtosis"],
             }
 
-            if self.dashboard.modo_comparacion:
-                self.dashboard.limpiar_comparacion()
+            if dashboard.modo_comparacion:
+                dashboard.limpiar_comparacion()
 
-            self.dashboard.mostrar_resultados_binomial(datos_resultados)
+            dashboard.mostrar_resultados_binomial(datos_resultados)
 
             x_destacado = valores_x[0] if len(valores_x) == 1 else None
-            self.dashboard.crear_grafico(
+            dashboard.crear_grafico(
                 valores_x, probabilidades, n, p, N, es_infinita, x_destacado
             )
 
@@ -673,19 +658,14 @@ class VentanaPrincipal:
             messagebox.showerror("Error de Validación", mensaje)
             return
 
-        valores_x = parsear_valores_x(x_texto, n)
-        valido, mensaje = validar_valores_x(valores_x, n)
+        valores_x, valido, mensaje = parsear_y_validar_valores_x(x_texto, n)
         if not valido:
             messagebox.showerror("Error de Validación", mensaje)
             return
 
         es_infinita = es_poblacion_infinita(n, N)
-        factor_correccion = None if es_infinita else calcular_factor_correccion(n, N)
         probabilidades = calcular_probabilidades(valores_x, n, p)
-        media = calcular_media(n, p)
-        desviacion = calcular_desviacion_estandar(n, p, N)
-        sesgo, interpretacion_sesgo = calcular_sesgo(n, p, N)
-        curtosis, interpretacion_curtosis = calcular_curtosis(n, p, N)
+        estadisticas = calcular_estadisticas(n, p, N)
 
         datos_resultados = {
             "n": n,
@@ -694,13 +674,13 @@ class VentanaPrincipal:
             "K": int(parametros["K"]),
             "valores_x": valores_x,
             "probabilidades": probabilidades,
-            "media": media,
-            "desviacion": desviacion,
-            "factor_correccion": factor_correccion,
-            "sesgo": sesgo,
-            "interpretacion_sesgo": interpretacion_sesgo,
-            "curtosis": curtosis,
-            "interpretacion_curtosis": interpretacion_curtosis,
+            "media": estadisticas["media"],
+            "desviacion": estadisticas["desviacion"],
+            "factor_correccion": estadisticas["factor_correccion"],
+            "sesgo": estadisticas["sesgo"],
+            "interpretacion_sesgo": estadisticas["interpretacion_sesgo"],
+            "curtosis": estadisticas["curtosis"],
+            "interpretacion_curtosis": estadisticas["interpretacion_curtosis"],
         }
 
         if self.dashboard.grafico_mm1:
@@ -723,19 +703,16 @@ class VentanaPrincipal:
             messagebox.showerror("Error de Validación", mensaje)
             return
 
-        valores_x = parsear_valores_x_hipergeometrica(x_texto, n, K)
-        valido, mensaje = validar_valores_x_hipergeometrica(valores_x, n, K)
+        valores_x, valido, mensaje = parsear_y_validar_valores_x_hipergeometrica(
+            x_texto, n, K
+        )
         if not valido:
             messagebox.showerror("Error de Validación", mensaje)
             return
 
         cumple_20, porcentaje_muestra = cumple_condicion_hipergeometrica(n, N)
         probabilidades = calcular_probabilidades_hipergeometrica(valores_x, n, N, K)
-        media = calcular_media_hipergeometrica(n, N, K)
-        desviacion = calcular_desviacion_hipergeometrica(n, N, K)
-        mediana = calcular_mediana_hipergeometrica(n, N, K)
-        sesgo, interpretacion_sesgo, _ = calcular_sesgo_hipergeometrica(n, N, K)
-        curtosis, interpretacion_curtosis = calcular_curtosis_hipergeometrica(n, N, K)
+        estadisticas = calcular_estadisticas_hipergeometrica(n, N, K)
 
         datos_resultados = {
             "N": N,
@@ -744,13 +721,13 @@ class VentanaPrincipal:
             "p": K / N,
             "valores_x": valores_x,
             "probabilidades": probabilidades,
-            "media": media,
-            "desviacion": desviacion,
-            "mediana": mediana,
-            "sesgo": sesgo,
-            "interpretacion_sesgo": interpretacion_sesgo,
-            "curtosis": curtosis,
-            "interpretacion_curtosis": interpretacion_curtosis,
+            "media": estadisticas["media"],
+            "desviacion": estadisticas["desviacion"],
+            "mediana": calcular_mediana_hipergeometrica(n, N, K),
+            "sesgo": estadisticas["sesgo"],
+            "interpretacion_sesgo": estadisticas["interpretacion_sesgo"],
+            "curtosis": estadisticas["curtosis"],
+            "interpretacion_curtosis": estadisticas["interpretacion_curtosis"],
             "cumple_condicion": cumple_20,
             "porcentaje_muestra": porcentaje_muestra,
         }